@@ -13,9 +13,13 @@ from orchestrator.services.config import get_settings
 from .providers.base import GitProvider, PRResult
 from .providers.bitbucket_provider import BitbucketProvider
 from .providers.github_provider import GitHubProvider
+from .urls import HOST_RE, PROVIDER_BY_HOST, match_host
 
 logger = structlog.get_logger()
 
+# owner/repo (or workspace/repo) following the host, with an optional .git suffix
+_REPO_PATH_RE = re.compile(r"([^/]+/[^/.\s]+?)(?:\.git)?")
+
 
 def parse_repo_from_url(url: str) -> tuple[str, GitProviderEnum]:
     """
@@ -27,17 +31,11 @@ def parse_repo_from_url(url: str) -> tuple[str, GitProviderEnum]:
       - git@github.com:owner/repo.git
       - https://bitbucket.org/workspace/repo.git
     """
-    # GitHub
-    gh_match = re.match(r"(?:https://github\.com/|git@github\.com:)([^/]+/[^/.]+?)(?:\.git)?$", url)
-    if gh_match:
-        return gh_match.group(1), GitProviderEnum.GITHUB
-
-    # Bitbucket
-    bb_match = re.match(
-        r"(?:https://bitbucket\.org/|git@bitbucket\.org:)([^/]+/[^/.]+?)(?:\.git)?$", url
-    )
-    if bb_match:
-        return bb_match.group(1), GitProviderEnum.BITBUCKET
+    host_match = HOST_RE.match(url)
+    if host_match:
+        repo_match = _REPO_PATH_RE.fullmatch(url, host_match.end())
+        if repo_match:
+            return repo_match.group(1), PROVIDER_BY_HOST[match_host(host_match)]
 
     raise ValueError(f"Cannot parse Git URL: {url}")
 
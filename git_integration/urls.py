@@ -0,0 +1,31 @@
+"""Git URL helpers shared by the Slack bot and GitManager."""
+
+from __future__ import annotations
+
+import re
+
+from orchestrator.models.task import GitProvider
+
+# Supported hosts. Adding a provider is one entry here — HOST_RE is derived from it.
+PROVIDER_BY_HOST: dict[str, GitProvider] = {
+    "github.com": GitProvider.GITHUB,
+    "bitbucket.org": GitProvider.BITBUCKET,
+}
+
+_HOSTS = "|".join(map(re.escape, PROVIDER_BY_HOST))
+
+# Matches the host portion of HTTPS and SSH remotes, each with its own separator:
+#   https://github.com/owner/repo   git@bitbucket.org:workspace/repo.git
+# The host is captured in group 1 (HTTPS) or group 2 (SSH) — use match_host().
+HOST_RE = re.compile(rf"(?:https://({_HOSTS})/|git@({_HOSTS}):)")
+
+
+def match_host(m: re.Match) -> str:
+    """The host captured by a HOST_RE match, whichever form the URL took."""
+    return m.group(1) or m.group(2)
+
+
+def detect_provider(url: str) -> GitProvider:
+    """Return the hosting provider for a repo URL, defaulting to GitHub."""
+    m = HOST_RE.search(url)
+    return PROVIDER_BY_HOST[match_host(m)] if m else GitProvider.GITHUB
@@ -57,6 +57,7 @@ export interface WarmPoolStats {
   claimed_vms: number;
   creating_vms: number;
   error_vms: number;
+  create_failures_total: number;
   backend: VMBackend;
   target_pool_size: number;
   avg_claim_time_ms: number;
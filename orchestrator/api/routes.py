@@ -168,7 +168,7 @@ async def cancel_task(task_id: str):
     if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
         raise HTTPException(status_code=400, detail=f"Task already {task.status.value}")
 
-    task.status = TaskStatus.CANCELLED
+    await _task_queue.cancel_task(task_id)
     return {"status": "cancelled", "task_id": task_id}
 
 
@@ -20,7 +20,7 @@ from fastapi.staticfiles import StaticFiles
 
 from git_integration.git_manager import GitManager
 from orchestrator.api.routes import broadcast_task_update, router, set_dependencies
-from orchestrator.models.task import Task
+from orchestrator.models.task import Task, TaskStatus
 from orchestrator.services.config import get_settings
 from orchestrator.services.pipeline import TaskPipeline, TaskQueue
 from slack_bot.bot import DucklingSlackBot
@@ -62,6 +62,8 @@ async def lifespan(app: FastAPI):
             }.get(task.status.value)
             if status_msg:
                 await slack_bot.post_task_update(task, status_msg)
+            if task.status == TaskStatus.COMPLETED and task.pr_url:
+                await slack_bot.post_pr_notification(task)
 
     async def on_step_complete(step_result):
         """Push step-level updates to WebSocket clients."""
@@ -114,6 +116,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await task_queue.stop()
     await pool_manager.stop()
+    if slack_bot:
+        await slack_bot.close()
     await logger.ainfo("Duckling shut down")
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
@@ -28,7 +28,8 @@ class VMBackend(str, Enum):
 
 class VM(BaseModel):
     """A single VM instance in the warm pool."""
-    id: str = Field(default_factory=lambda: f"vm-{uuid.uuid4().hex[:12]}")
+    # Same 12-hex-char shape as a truncated uuid4, without building a UUID object
+    id: str = Field(default_factory=lambda: f"vm-{secrets.token_hex(6)}")
     backend: VMBackend = VMBackend.DOCKER
     state: VMState = VMState.CREATING
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -40,6 +41,7 @@ class VM(BaseModel):
     ip_address: Optional[str] = None
     ssh_port: Optional[int] = None
     repo_cached: bool = False
+    reuse_count: int = 0  # tasks served after the first, via WarmPoolManager recycling
     memory_mb: int = 2048
     vcpu_count: int = 2
     error_message: Optional[str] = None
@@ -62,6 +64,7 @@ class WarmPoolStats(BaseModel):
     claimed_vms: int = 0
     creating_vms: int = 0
     error_vms: int = 0
+    create_failures_total: int = 0
     backend: VMBackend = VMBackend.DOCKER
     target_pool_size: int = 10
     avg_claim_time_ms: float = 0.0
@@ -73,6 +73,12 @@ class Settings(BaseModel):
     snapshot_dir: str = os.getenv("FIRECRACKER_SNAPSHOT_DIR", "/var/lib/duckling/snapshots")
     warm_pool_size: int = int(os.getenv("WARM_POOL_SIZE", "10"))
     warm_pool_refill_threshold: int = int(os.getenv("WARM_POOL_REFILL_THRESHOLD", "3"))
+    # Tasks a VM may serve before it is destroyed; 0 = fresh VM for every task.
+    # A reset restores /workspace and site-packages, but files a repo's setup code
+    # writes elsewhere carry over into the next task — keep 0 for untrusted repos.
+    max_vm_reuses: int = int(os.getenv("MAX_VM_REUSES", "0"))
+    # Concurrent VM builds for claims that find the pool empty
+    warm_pool_max_on_demand: int = int(os.getenv("WARM_POOL_MAX_ON_DEMAND", "2"))
 
     # Review Pipeline
     review_max_files: int = int(os.getenv("REVIEW_MAX_FILES", "25"))
@@ -87,6 +93,12 @@ class Settings(BaseModel):
     docker_image: str = os.getenv("DOCKER_IMAGE", "duckling/agent-runner:latest")
     docker_network: str = os.getenv("DOCKER_NETWORK", "duckling-net")
     use_docker_fallback: bool = os.getenv("USE_DOCKER_FALLBACK", "true").lower() == "true"
+    # Worker threads for docker-py control-plane calls (container create/remove)
+    docker_concurrency: int = int(os.getenv("DOCKER_CONCURRENCY", "8"))
+    # Of those, how many may be container creates (keeps fills from starving destroys)
+    docker_create_concurrency: int = int(os.getenv("DOCKER_CREATE_CONCURRENCY", "4"))
+    # Worker threads for execs, each held for the whole command (agent runs included)
+    docker_exec_concurrency: int = int(os.getenv("DOCKER_EXEC_CONCURRENCY", "32"))
 
     @property
     def is_production(self) -> bool:
@@ -22,9 +22,9 @@ from dataclasses import dataclass
 from orchestrator.models.task import TaskMode
 
 
-@dataclass
+@dataclass(frozen=True)
 class IntentResult:
-    """Result of intent classification."""
+    """Result of intent classification. Immutable so results can be cached and shared."""
 
     mode: TaskMode
     confidence: float  # 0.0 to 1.0
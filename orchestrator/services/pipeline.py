@@ -21,7 +21,9 @@ Each stage publishes events for real-time monitoring via WebSocket.
 from __future__ import annotations
 
 import asyncio
+import functools
 import time
+from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
 import structlog
@@ -35,6 +37,8 @@ from warm_pool.pool_manager import WarmPoolManager
 
 logger = structlog.get_logger()
 
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
 
 class TaskPipeline:
     """
@@ -67,10 +71,15 @@ class TaskPipeline:
         Returns the updated task with results.
         """
         if task.mode == TaskMode.REVIEW:
-            return await self._execute_review(task)
-        if task.mode == TaskMode.PEER_REVIEW:
-            return await self._execute_peer_review(task)
-        return await self._execute_code(task)
+            task = await self._execute_review(task)
+        elif task.mode == TaskMode.PEER_REVIEW:
+            task = await self._execute_peer_review(task)
+        else:
+            task = await self._execute_code(task)
+
+        # The mark_* helpers set the final status directly, so announce it here
+        await self._notify_status(task)
+        return task
 
     async def _execute_review(self, task: Task) -> Task:
         """
@@ -352,6 +361,9 @@ class TaskPipeline:
     async def _update_status(self, task: Task, status: TaskStatus):
         """Update task status and notify listeners."""
         task.status = status
+        await self._notify_status(task)
+
+    async def _notify_status(self, task: Task):
         if self.on_status_change:
             try:
                 await self.on_status_change(task)
@@ -361,6 +373,14 @@ class TaskPipeline:
                 )
 
 
+@dataclass(slots=True)
+class TaskEntry:
+    """A submitted task and, while it is running, the asyncio task executing it."""
+
+    task: Task
+    async_task: Optional[asyncio.Task] = None
+
+
 class TaskQueue:
     """
     In-memory task queue with priority ordering.
@@ -371,8 +391,8 @@ class TaskQueue:
         self.pipeline = pipeline
         self.max_concurrent = max_concurrent
         self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
-        self._active: dict[str, asyncio.Task] = {}
-        self._tasks: dict[str, Task] = {}
+        self._entries: dict[str, TaskEntry] = {}
+        self._active_count = 0
         self._running = False
 
     async def start(self):
@@ -383,22 +403,69 @@ class TaskQueue:
 
     async def stop(self):
         self._running = False
-        for task in self._active.values():
-            task.cancel()
+        await self.cancel_many([tid for tid, e in self._entries.items() if e.async_task])
+
+    async def cancel_task(self, task_id: str) -> bool:
+        """
+        Cancel a pending or running task.
+
+        Pending tasks are marked CANCELLED and skipped when dequeued. Running
+        tasks have their pipeline coroutine cancelled and awaited, so the VM
+        is released before this returns. Returns False if the task is unknown
+        or already finished.
+        """
+        entry = self._entries.get(task_id)
+        if not entry or entry.task.status in _TERMINAL_STATUSES:
+            return False
+
+        entry.task.status = TaskStatus.CANCELLED
+        # Detach before awaiting so a concurrent cancel can't cancel it twice
+        async_task, entry.async_task = entry.async_task, None
+        if async_task and not async_task.done():
+            async_task.cancel()
+            # wait() doesn't re-raise the task's outcome, so only a cancellation
+            # aimed at our own caller can propagate from here
+            await asyncio.wait({async_task})
+
+        await logger.ainfo("Task cancelled", task_id=task_id, was_running=async_task is not None)
+        return True
+
+    async def cancel_many(self, task_ids: list[str]) -> int:
+        """Cancel several tasks at once — all cancellations are awaited together."""
+        live = []
+        cancelled = 0
+        for task_id in task_ids:
+            entry = self._entries.get(task_id)
+            if not entry:
+                continue
+            if entry.task.status not in _TERMINAL_STATUSES:
+                entry.task.status = TaskStatus.CANCELLED
+                cancelled += 1
+            async_task, entry.async_task = entry.async_task, None
+            if async_task and not async_task.done():
+                async_task.cancel()
+                live.append(async_task)
+
+        if live:
+            await asyncio.gather(*live, return_exceptions=True)
+        return cancelled
 
     async def submit(self, task: Task) -> Task:
         """Submit a task to the queue."""
-        self._tasks[task.id] = task
+        self._entries[task.id] = TaskEntry(task)
         priority = {"critical": 0, "high": 1, "medium": 2, "low": 3}
         await self._queue.put((priority.get(task.priority.value, 2), task.id))
         await logger.ainfo("Task queued", task_id=task.id, priority=task.priority)
         return task
 
     def get_task(self, task_id: str) -> Optional[Task]:
-        return self._tasks.get(task_id)
+        entry = self._entries.get(task_id)
+        return entry.task if entry else None
 
     def list_tasks(self, page: int = 1, per_page: int = 20) -> tuple[list[Task], int]:
-        all_tasks = sorted(self._tasks.values(), key=lambda t: t.created_at, reverse=True)
+        all_tasks = sorted(
+            (e.task for e in self._entries.values()), key=lambda t: t.created_at, reverse=True
+        )
         total = len(all_tasks)
         start = (page - 1) * per_page
         return all_tasks[start : start + per_page], total
@@ -407,13 +474,8 @@ class TaskQueue:
         """Main loop that pulls tasks and dispatches them."""
         while self._running:
             try:
-                # Clean up completed tasks
-                done = [tid for tid, t in self._active.items() if t.done()]
-                for tid in done:
-                    del self._active[tid]
-
                 # Check capacity
-                if len(self._active) >= self.max_concurrent:
+                if self._active_count >= self.max_concurrent:
                     await asyncio.sleep(0.5)
                     continue
 
@@ -423,12 +485,14 @@ class TaskQueue:
                 except asyncio.TimeoutError:
                     continue
 
-                task = self._tasks.get(task_id)
-                if not task:
+                entry = self._entries.get(task_id)
+                if not entry or entry.task.status == TaskStatus.CANCELLED:
                     continue
 
                 # Dispatch
-                self._active[task_id] = asyncio.create_task(self.pipeline.execute(task))
+                entry.async_task = asyncio.create_task(self.pipeline.execute(entry.task))
+                self._active_count += 1
+                entry.async_task.add_done_callback(functools.partial(self._on_task_done, entry))
                 await logger.ainfo("Task dispatched", task_id=task_id)
 
             except asyncio.CancelledError:
@@ -436,3 +500,8 @@ class TaskQueue:
             except Exception as e:
                 await logger.aerror("Queue processing error", error=str(e))
                 await asyncio.sleep(1)
+
+    def _on_task_done(self, entry: TaskEntry, async_task: asyncio.Task) -> None:
+        self._active_count -= 1
+        if entry.async_task is async_task:
+            entry.async_task = None
@@ -15,21 +15,115 @@ The bot:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
+import aiohttp
 import structlog
 from slack_bolt.async_app import AsyncApp
 from slack_sdk.web.async_client import AsyncWebClient
 
-from orchestrator.models.task import GitProvider, Task, TaskCreate, TaskMode, TaskPriority, TaskSource
+from git_integration.urls import detect_provider
+from orchestrator.models.task import (
+    GitProvider,
+    Task,
+    TaskCreate,
+    TaskMode,
+    TaskPriority,
+    TaskSource,
+    TaskStatus,
+)
 from orchestrator.services.config import get_settings
-from orchestrator.services.intent import classify_intent
+from orchestrator.services.intent import IntentResult, classify_intent
 
 if TYPE_CHECKING:
     from orchestrator.services.pipeline import TaskQueue
 
-logger = structlog.get_logger()
+try:
+    import orjson
+except ImportError:  # optional speedup — falls back to stdlib json
+    orjson = None
+
+logger = structlog.get_logger(__name__, component="slack_bot")
+
+# Slack emoji shown next to each task status in /duckling-status
+_STATUS_EMOJI: Mapping[str, str] = MappingProxyType(
+    {
+        "pending": "hourglass_flowing_sand",
+        "claiming_vm": "rocket",
+        "running": "robot_face",
+        "testing": "test_tube",
+        "creating_pr": "memo",
+        "completed": "white_check_mark",
+        "failed": "x",
+        "cancelled": "stop_sign",
+    }
+)
+
+# Verb shown in the dispatch confirmation for each resolved task mode
+_MODE_LABEL: Mapping[TaskMode, str] = MappingProxyType(
+    {
+        TaskMode.REVIEW: "Reviewing",
+        TaskMode.CODE: "Coding",
+        TaskMode.PEER_REVIEW: "Peer-reviewing",
+    }
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_cached(description: str, target_branch: Optional[str]) -> IntentResult:
+    """Exact-match cache over classify_intent — retries often resend the same text."""
+    return classify_intent(description=description, target_branch=target_branch)
+
+
+# mrkdwn bodies for the dispatch and PR-ready messages, filled with str.format per message
+_DISPATCH_TEXT = (
+    "*Duckling dispatched!*\n\n"
+    "*Task:* {description}\n"
+    "*Mode:* `{mode}` ({reason})\n"
+    "*Repo:* `{repo}`\n"
+    "*Requested by:* <@{user}>\n"
+    "*Status:* Claiming VM..."
+)
+
+_PR_READY_TEXT = (
+    ":white_check_mark: *PR Ready!*\n\n"
+    "<{pr_url}|View Pull Request>\n\n"
+    "*Files changed:* {files_changed}\n"
+    "*Iterations:* {iterations}\n"
+    "*Duration:* {duration:.0f}s"
+)
+
+
+def _json_dumps(obj) -> str:
+    """Request-body encoder for the Slack HTTP session (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Command parsing — compiled once, these run on every mention and slash command
+_MENTION_RE = re.compile(r"<@[A-Z0-9]+>")
+_REPO_FLAG_RE = re.compile(r"--repo\s+(\S+)")
+_BRANCH_FLAG_RE = re.compile(r"--branch\s+(\S+)")
+_PRIORITY_FLAG_RE = re.compile(r"--priority\s+(low|medium|high|critical)")
+
+# Thread update batching — a burst of progress lines is held open this long
+# (or until this many lines accumulate) before being posted as one message
+_UPDATE_FLUSH_INTERVAL = 0.75
+_UPDATE_MAX_BATCH = 8
+# A thread's sender exits after this long with nothing to send; the next
+# update for the thread simply starts a new one
+_UPDATE_IDLE_TIMEOUT = 30.0
+# How long close() waits for buffered updates to go out before dropping them
+_UPDATE_CLOSE_TIMEOUT = 5.0
+
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
 
 
 class DucklingSlackBot:
@@ -41,10 +135,22 @@ class DucklingSlackBot:
         settings = get_settings()
         self.task_queue = task_queue
 
+        # One long-lived HTTP session for every Slack API call. Without it the
+        # SDK opens (and TLS-handshakes) a fresh aiohttp session per request.
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=_json_dumps,
+        )
         self.app = AsyncApp(
-            token=settings.slack_bot_token,
+            client=AsyncWebClient(token=settings.slack_bot_token, session=self._session),
             signing_secret=settings.slack_signing_secret,
         )
+        self._client: AsyncWebClient = self.app.client
+
+        # Per-thread update batching: (channel, thread_ts) -> pending lines / sender task
+        self._update_queues: dict[tuple[str, str], asyncio.Queue[Optional[str]]] = {}
+        self._update_flushers: dict[tuple[str, str], asyncio.Task] = {}
+        self._submissions: set[asyncio.Task] = set()
 
         # Register handlers
         self._register_handlers()
@@ -79,17 +185,10 @@ class DucklingSlackBot:
                 return
 
             # ── Intent classification ────────────────────────────
-            intent = classify_intent(
-                description=task_params["description"],
-                target_branch=task_params.get("target_branch"),
-            )
+            intent = _classify_cached(task_params["description"], task_params.get("target_branch"))
             resolved_mode = intent.mode
 
-            mode_label = {
-                TaskMode.REVIEW: "Reviewing",
-                TaskMode.CODE: "Coding",
-                TaskMode.PEER_REVIEW: "Peer-reviewing",
-            }.get(resolved_mode, "Working on")
+            mode_label = _MODE_LABEL.get(resolved_mode, "Working on")
 
             # Post initial status message
             result = await client.chat_postMessage(
@@ -100,12 +199,13 @@ class DucklingSlackBot:
                         "type": "section",
                         "text": {
                             "type": "mrkdwn",
-                            "text": f"*Duckling dispatched!*\n\n"
-                            f"*Task:* {task_params['description']}\n"
-                            f"*Mode:* `{resolved_mode.value}` ({intent.reason})\n"
-                            f"*Repo:* `{task_params['repo_url']}`\n"
-                            f"*Requested by:* <@{user_id}>\n"
-                            f"*Status:* Claiming VM...",
+                            "text": _DISPATCH_TEXT.format(
+                                description=task_params["description"],
+                                mode=resolved_mode.value,
+                                reason=intent.reason,
+                                repo=task_params["repo_url"],
+                                user=user_id,
+                            ),
                         },
                     },
                     {"type": "divider"},
@@ -140,7 +240,9 @@ class DucklingSlackBot:
             )
 
             if self.task_queue:
-                await self.task_queue.submit(task)
+                # Queue submission overlaps the confirmation post; a failed
+                # submit is reported in the thread
+                self._submit_in_background(task)
                 await client.chat_postMessage(
                     channel=channel_id,
                     thread_ts=thread_ts,
@@ -152,7 +254,7 @@ class DucklingSlackBot:
             """Handle @duckling mentions in channels."""
             text = event.get("text", "")
             # Remove the bot mention
-            text = re.sub(r"<@[A-Z0-9]+>", "", text).strip()
+            text = _MENTION_RE.sub("", text).strip()
 
             if not text:
                 await say(
@@ -172,10 +274,7 @@ class DucklingSlackBot:
                 return
 
             # ── Intent classification ────────────────────────────
-            intent = classify_intent(
-                description=task_params["description"],
-                target_branch=task_params.get("target_branch"),
-            )
+            intent = _classify_cached(task_params["description"], task_params.get("target_branch"))
             resolved_mode = intent.mode
 
             # Submit task (same flow as slash command)
@@ -193,7 +292,7 @@ class DucklingSlackBot:
             )
 
             if self.task_queue:
-                await self.task_queue.submit(task)
+                self._submit_in_background(task)
 
             await say(
                 text=f"On it! Task `{task.id[:8]}` queued as *{resolved_mode.value}* ({intent.reason}). I'll post updates here.",
@@ -222,24 +321,14 @@ class DucklingSlackBot:
             ]
 
             for task in tasks:
-                status_emoji = {
-                    "pending": "hourglass_flowing_sand",
-                    "claiming_vm": "rocket",
-                    "running": "robot_face",
-                    "testing": "test_tube",
-                    "creating_pr": "memo",
-                    "completed": "white_check_mark",
-                    "failed": "x",
-                    "cancelled": "stop_sign",
-                }.get(task.status.value, "question")
-
+                status = task.status.value
                 blocks.append(
                     {
                         "type": "section",
                         "text": {
                             "type": "mrkdwn",
-                            "text": f":{status_emoji}: `{task.id[:8]}` — {task.description[:60]}\n"
-                            f"Status: *{task.status.value}*"
+                            "text": f":{_STATUS_EMOJI.get(status, 'question')}: `{task.id[:8]}` — {task.description[:60]}\n"
+                            f"Status: *{status}*"
                             + (f" | <{task.pr_url}|View PR>" if task.pr_url else ""),
                         },
                     }
@@ -247,60 +336,162 @@ class DucklingSlackBot:
 
             await say(blocks=blocks, text=f"{total} duckling(s) tracked")
 
+    def _submit_in_background(self, task: Task) -> None:
+        """Queue the task without holding up the Slack reply that confirms it."""
+        submit_task = asyncio.create_task(self._submit(task))
+        self._submissions.add(submit_task)  # the loop only keeps weak refs to tasks
+        submit_task.add_done_callback(self._submissions.discard)
+
+    async def _submit(self, task: Task) -> None:
+        try:
+            await self.task_queue.submit(task)
+        except Exception as e:
+            logger.error("Task submission failed", task_id=task.id, error=str(e))
+            try:
+                await self._client.chat_postMessage(
+                    channel=task.slack_channel_id,
+                    thread_ts=task.slack_thread_ts,
+                    text=f":x: Task `{task.id[:8]}` could not be queued: {e}",
+                )
+            except Exception as post_error:
+                logger.warning(
+                    "Slack submit-failure notice failed", task_id=task.id, error=str(post_error)
+                )
+
     def _parse_command(self, text: str) -> dict:
         """Parse a slash command or mention into task parameters."""
         params: dict = {}
 
         # Extract --repo flag
-        repo_match = re.search(r"--repo\s+(\S+)", text)
+        repo_match = _REPO_FLAG_RE.search(text)
         if repo_match:
             params["repo_url"] = repo_match.group(1)
             text = text[: repo_match.start()] + text[repo_match.end() :]
 
         # Extract --branch flag
-        branch_match = re.search(r"--branch\s+(\S+)", text)
+        branch_match = _BRANCH_FLAG_RE.search(text)
         if branch_match:
             params["branch"] = branch_match.group(1)
             text = text[: branch_match.start()] + text[branch_match.end() :]
 
         # Extract --priority flag
-        priority_match = re.search(r"--priority\s+(low|medium|high|critical)", text)
+        priority_match = _PRIORITY_FLAG_RE.search(text)
         if priority_match:
             params["priority"] = TaskPriority(priority_match.group(1))
             text = text[: priority_match.start()] + text[priority_match.end() :]
 
         # Detect provider from URL
         if params.get("repo_url"):
-            if "bitbucket" in params["repo_url"]:
-                params["provider"] = GitProvider.BITBUCKET
-            else:
-                params["provider"] = GitProvider.GITHUB
+            params["provider"] = detect_provider(params["repo_url"])
 
         params["description"] = text.strip()
         return params
 
+    async def close(self):
+        """Flush pending thread updates, then close the shared HTTP session."""
+        for queue in self._update_queues.values():
+            queue.put_nowait(None)  # sentinel: drain and exit
+        flushers = list(self._update_flushers.values())
+        self._update_flushers.clear()
+        self._update_queues.clear()
+        if flushers:
+            # Bounded: a hung Slack API call shouldn't stall shutdown
+            _, stuck = await asyncio.wait(flushers, timeout=_UPDATE_CLOSE_TIMEOUT)
+            for flusher in stuck:
+                flusher.cancel()
+        await self._session.close()
+
     async def post_task_update(self, task: Task, message: str):
-        """Post a threaded update to the original Slack message."""
+        """
+        Queue a threaded update to the original Slack message.
+
+        Updates are coalesced per thread: the first one goes out immediately,
+        and anything arriving while a send is in flight is batched into the
+        next message. Terminal statuses force a flush before returning; other
+        threads' senders exit on their own once idle.
+        """
         if not task.slack_channel_id or not task.slack_thread_ts:
             return
 
-        settings = get_settings()
-        client = AsyncWebClient(token=settings.slack_bot_token)
-        await client.chat_postMessage(
-            channel=task.slack_channel_id,
-            thread_ts=task.slack_thread_ts,
-            text=message,
-        )
+        key = (task.slack_channel_id, task.slack_thread_ts)
+        queue = self._update_queues.get(key)
+        if queue is None:
+            queue = self._update_queues[key] = asyncio.Queue()
+            self._update_flushers[key] = asyncio.create_task(self._flush_updates(key, queue))
+        queue.put_nowait(message)
+
+        if task.status in _TERMINAL_STATUSES:
+            await self.flush_task_updates(task)
+
+    async def flush_task_updates(self, task: Task):
+        """Send any buffered updates for the task's thread and stop its flusher."""
+        key = (task.slack_channel_id, task.slack_thread_ts)
+        queue = self._update_queues.pop(key, None)
+        flusher = self._update_flushers.pop(key, None)
+        if queue is None or flusher is None:
+            return
+
+        queue.put_nowait(None)  # sentinel: drain and exit
+        await flusher
+
+    async def _flush_updates(self, key: tuple[str, str], queue: asyncio.Queue[Optional[str]]):
+        """Background sender for one thread — joins queued updates into single messages."""
+        channel, thread_ts = key
+        loop = asyncio.get_running_loop()
+        last_sent = float("-inf")
+
+        while True:
+            try:
+                batch = [await asyncio.wait_for(queue.get(), timeout=_UPDATE_IDLE_TIMEOUT)]
+            except asyncio.TimeoutError:
+                if not queue.empty():
+                    continue  # an update landed as the wait timed out
+                # Idle: drop this thread's entries (unless a flush already did)
+                if self._update_queues.get(key) is queue:
+                    del self._update_queues[key]
+                    del self._update_flushers[key]
+                return
+
+            # Mid-burst: hold the batch open briefly so a chatty agent
+            # produces one message instead of dozens.
+            deadline = last_sent + _UPDATE_FLUSH_INTERVAL
+            while len(batch) < _UPDATE_MAX_BATCH and batch[-1] is not None:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            done = batch[-1] is None
+            lines = [line for line in batch if line is not None]
+            if lines:
+                try:
+                    await self._client.chat_postMessage(
+                        channel=channel,
+                        thread_ts=thread_ts,
+                        text="\n".join(lines),
+                    )
+                except Exception as e:
+                    await logger.awarning("Slack thread update failed", channel=channel, error=str(e))
+                last_sent = loop.time()
+
+            if done:
+                return
 
     async def post_pr_notification(self, task: Task):
         """Post the final PR link to the Slack thread."""
         if not task.pr_url or not task.slack_channel_id:
             return
 
-        settings = get_settings()
-        client = AsyncWebClient(token=settings.slack_bot_token)
+        # Keep the thread in order: pending progress lines land before the PR link
+        await self.flush_task_updates(task)
 
-        await client.chat_postMessage(
+        await self._client.chat_postMessage(
             channel=task.slack_channel_id,
             thread_ts=task.slack_thread_ts,
             text=f"PR ready for review: {task.pr_url}",
@@ -309,11 +500,12 @@ class DucklingSlackBot:
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f":white_check_mark: *PR Ready!*\n\n"
-                        f"<{task.pr_url}|View Pull Request>\n\n"
-                        f"*Files changed:* {len(task.files_changed)}\n"
-                        f"*Iterations:* {task.iterations_used}\n"
-                        f"*Duration:* {task.duration_seconds:.0f}s",
+                        "text": _PR_READY_TEXT.format(
+                            pr_url=task.pr_url,
+                            files_changed=len(task.files_changed),
+                            iterations=task.iterations_used,
+                            duration=task.duration_seconds,
+                        ),
                     },
                 },
             ],
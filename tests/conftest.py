@@ -0,0 +1,106 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import inspect
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from orchestrator.services.config import Settings
+
+try:
+    import uvloop
+except ImportError:  # optional, from the ``speedups`` extra
+    uvloop = None
+
+# Anything that could reach a real service is blanked out so tests never pick
+# up credentials from a developer's .env file.
+_TEST_OVERRIDES = {
+    "env": "test",
+    "slack_bot_token": "",
+    "slack_signing_secret": "",
+    "slack_app_token": "",
+    "github_token": "",
+    "bitbucket_username": "",
+    "bitbucket_app_password": "",
+    "bitbucket_workspace": "",
+    "anthropic_api_key": "",
+    "openai_api_key": "",
+    "opencode_zen_api_key": "",
+    "copilot_openai_api_key": "",
+    "warm_pool_size": 2,
+    "warm_pool_refill_threshold": 1,
+    "use_docker_fallback": True,
+    "docker_image": "test:latest",
+    "docker_network": "bridge",
+}
+
+
+@pytest.fixture(scope="session")
+def mock_settings() -> SimpleNamespace:
+    """
+    Read-only settings stub shared by the whole session.
+
+    A plain namespace rather than a MagicMock — nothing asserts on settings
+    access, so there is no need to pay for call tracking. Patch it into the
+    module under test with ``lambda: mock_settings``.
+    """
+    defaults = Settings().model_dump()
+    return SimpleNamespace(**{**defaults, **_TEST_OVERRIDES}, is_production=False)
+
+
+class ConcurrencyProbe:
+    """Wraps callables to record how many calls were in flight at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()  # sync callables may run on executor threads
+
+    def wrap(self, fn, hold: float = 0.0):
+        """Count calls to ``fn`` (sync or async), holding each open ``hold`` seconds first."""
+        if inspect.iscoroutinefunction(fn):
+
+            async def _counted_async(*args, **kwargs):
+                self._enter()
+                try:
+                    await asyncio.sleep(hold)
+                    return await fn(*args, **kwargs)
+                finally:
+                    self._exit()
+
+            return _counted_async
+
+        def _counted(*args, **kwargs):
+            self._enter()
+            try:
+                time.sleep(hold)
+                return fn(*args, **kwargs)
+            finally:
+                self._exit()
+
+        return _counted
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def concurrency_probe() -> ConcurrencyProbe:
+    return ConcurrencyProbe()
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop with the ``speedups`` extra (needs pytest-asyncio 1.4+)."""
+        return {"uvloop": uvloop.new_event_loop}
@@ -20,24 +20,16 @@ class TestEngineFactory:
         with pytest.raises(ValueError, match="Unknown agent engine"):
             create_engine("unknown")
 
-    def test_goose_engine_not_started(self):
+    async def test_goose_engine_not_started(self):
         """GooseEngine should return failure if execute_prompt called before start."""
-        import asyncio
-
         engine = create_engine("goose")
-        success, output = asyncio.get_event_loop().run_until_complete(
-            engine.execute_prompt("test prompt")
-        )
+        success, output = await engine.execute_prompt("test prompt")
         assert not success
         assert "not started" in output.lower()
 
-    def test_copilot_engine_not_started(self):
+    async def test_copilot_engine_not_started(self):
         """CopilotEngine should return failure if execute_prompt called before start."""
-        import asyncio
-
         engine = create_engine("copilot")
-        success, output = asyncio.get_event_loop().run_until_complete(
-            engine.execute_prompt("test prompt")
-        )
+        success, output = await engine.execute_prompt("test prompt")
         assert not success
         assert "not started" in output.lower()
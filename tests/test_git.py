@@ -0,0 +1,94 @@
+"""Tests for Git URL parsing, provider detection, and PR body generation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from git_integration.git_manager import GitManager, parse_repo_from_url
+from git_integration.urls import detect_provider
+from orchestrator.models.task import GitProvider
+
+
+class TestParseRepoFromUrl:
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://github.com/example-org/auth-service", "example-org/auth-service"),
+            ("https://github.com/example-org/auth-service.git", "example-org/auth-service"),
+            ("git@github.com:example-org/auth-service.git", "example-org/auth-service"),
+            ("git@github.com:example-org/auth-service", "example-org/auth-service"),
+        ],
+    )
+    def test_github_urls(self, url: str, expected: str):
+        repo, provider = parse_repo_from_url(url)
+        assert repo == expected
+        assert provider == GitProvider.GITHUB
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://bitbucket.org/workspace/payments", "workspace/payments"),
+            ("https://bitbucket.org/workspace/payments.git", "workspace/payments"),
+            ("git@bitbucket.org:workspace/payments.git", "workspace/payments"),
+        ],
+    )
+    def test_bitbucket_urls(self, url: str, expected: str):
+        repo, provider = parse_repo_from_url(url)
+        assert repo == expected
+        assert provider == GitProvider.BITBUCKET
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://gitlab.com/example-org/auth-service",
+            "https://github.com/example-org",
+            "https://github.com/example-org/auth-service/tree/main",
+            "not a url",
+            # Each scheme keeps its own separator
+            "git@github.com/example-org/auth-service",
+            "https://github.com:example-org/auth-service",
+            "https://github.com/example-org/auth-service\n",
+        ],
+    )
+    def test_unparseable_urls_raise(self, url: str):
+        with pytest.raises(ValueError, match="Cannot parse Git URL"):
+            parse_repo_from_url(url)
+
+
+class TestDetectProvider:
+    def test_github(self):
+        assert detect_provider("https://github.com/example-org/repo") == GitProvider.GITHUB
+
+    def test_bitbucket_ssh(self):
+        assert detect_provider("git@bitbucket.org:workspace/repo.git") == GitProvider.BITBUCKET
+
+    def test_mixed_separator_defaults_to_github(self):
+        assert detect_provider("git@bitbucket.org/workspace/repo") == GitProvider.GITHUB
+
+    def test_unknown_host_defaults_to_github(self):
+        assert detect_provider("https://gitlab.com/example-org/repo") == GitProvider.GITHUB
+
+
+@pytest.fixture(scope="module")
+def git_manager(mock_settings):
+    """One GitManager for the module — _build_pr_body never touches provider state."""
+    with (
+        patch("git_integration.providers.github_provider.get_settings", lambda: mock_settings),
+        patch("git_integration.providers.bitbucket_provider.get_settings", lambda: mock_settings),
+    ):
+        yield GitManager()
+
+
+class TestGitManagerBuildPrBody:
+    def test_build_pr_body_includes_description(self, git_manager):
+        body = git_manager._build_pr_body("Fix the flaky session test", "duckling/abc12345")
+        assert "Fix the flaky session test" in body
+
+    def test_build_pr_body_includes_branch(self, git_manager):
+        body = git_manager._build_pr_body("Fix it", "duckling/abc12345")
+        assert "**Branch:** `duckling/abc12345`" in body
+
+    def test_build_pr_body_has_review_guidance(self, git_manager):
+        body = git_manager._build_pr_body("Fix it", "duckling/abc12345")
+        assert body.startswith("## Duckling-Generated PR")
+        assert "### How to review" in body
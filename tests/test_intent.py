@@ -1,5 +1,7 @@
 """Tests for the intent classifier."""
 
+import dataclasses
+
 import pytest
 
 from orchestrator.models.task import TaskMode
@@ -169,3 +171,10 @@ class TestIntentClassifier:
     def test_result_confidence_in_range(self):
         result = classify_intent("Fix the bug")
         assert 0.0 <= result.confidence <= 1.0
+
+    def test_result_is_immutable(self):
+        """Results are shared out of the Slack bot's classification cache."""
+        result = classify_intent("Fix the bug")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.mode = TaskMode.REVIEW
+        assert hash(result) == hash(classify_intent("Fix the bug"))
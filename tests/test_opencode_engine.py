@@ -0,0 +1,114 @@
+"""Tests for the OpenCode engine: factory wiring, initial state, and pure helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from agent_runner.engine import AgentEngine, create_engine
+from agent_runner.opencode.opencode_engine import OpenCodeEngine
+
+
+def _settings(**overrides) -> SimpleNamespace:
+    fields = {
+        "openai_api_key": "",
+        "openai_host": "",
+        "anthropic_api_key": "",
+        "opencode_zen_api_key": "",
+        "opencode_model": "",
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(scope="class")
+def engine() -> OpenCodeEngine:
+    """One engine per test class — the helpers under test never touch engine state."""
+    return OpenCodeEngine()
+
+
+@pytest.fixture(scope="class")
+def fresh_engine() -> AgentEngine:
+    """A factory-built engine that is never started; shared read-only per class."""
+    return create_engine("opencode")
+
+
+class TestOpenCodeEngineCreation:
+    def test_create_opencode_engine(self, fresh_engine):
+        assert isinstance(fresh_engine, AgentEngine)
+        assert type(fresh_engine).__name__ == "OpenCodeEngine"
+        assert fresh_engine.name == "OpenCode"
+
+
+class TestOpenCodeEngineNotStarted:
+    @pytest.mark.parametrize("attr", ["_client", "_session_id", "_vm", "_backend"])
+    def test_attr_is_none_initially(self, fresh_engine, attr):
+        assert getattr(fresh_engine, attr) is None
+
+    async def test_execute_prompt_before_start(self, fresh_engine):
+        success, output = await fresh_engine.execute_prompt("test prompt")
+        assert not success
+        assert "not started" in output.lower()
+
+
+class TestOpenCodeExtractOutput:
+    def test_joins_text_parts(self, engine):
+        data = {
+            "parts": [
+                {"type": "step-start"},
+                {"type": "text", "text": "first"},
+                {"type": "reasoning", "text": "hidden"},
+                {"type": "text", "text": "second"},
+            ]
+        }
+        assert engine._extract_output(data) == "first\nsecond"
+
+    def test_includes_tool_results(self, engine):
+        data = {"parts": [{"type": "tool-invocation", "toolName": "bash", "result": "ok"}]}
+        assert engine._extract_output(data) == "[bash]: ok"
+
+    def test_skips_tool_invocations_without_result(self, engine):
+        data = {
+            "parts": [{"type": "tool-invocation", "toolName": "bash"}],
+            "info": {"content": "fallback"},
+        }
+        assert engine._extract_output(data) == "fallback"
+
+    def test_falls_back_to_info_content(self, engine):
+        assert engine._extract_output({"info": {"content": "from info"}}) == "from info"
+
+    def test_last_resort_dumps_json(self, engine):
+        assert '"unexpected": true' in engine._extract_output({"unexpected": True})
+
+
+class TestOpenCodeBuildConfig:
+    def test_default_model(self, engine):
+        config = engine._build_config(_settings())
+        assert config["model"] == "opencode/big-pickle"
+        assert config["permission"] == "allow"
+
+    def test_explicit_model(self, engine):
+        config = engine._build_config(_settings(opencode_model="anthropic/claude-sonnet-4"))
+        assert config["model"] == "anthropic/claude-sonnet-4"
+
+
+class TestOpenCodeBuildEnvExports:
+    def test_no_keys_returns_empty(self, engine):
+        assert engine._build_env_exports(_settings()) == ""
+
+    def test_openai_key_exported(self, engine):
+        exports = engine._build_env_exports(_settings(openai_api_key="sk-test"))
+        assert exports == "export OPENAI_API_KEY='sk-test' && "
+
+    def test_openrouter_key_is_unset(self, engine):
+        exports = engine._build_env_exports(
+            _settings(openai_api_key="sk-or-abc", openai_host="https://openrouter.ai/api/")
+        )
+        assert "unset OPENAI_API_KEY" in exports
+        assert "sk-or-abc" not in exports
+
+    def test_anthropic_and_zen_keys(self, engine):
+        exports = engine._build_env_exports(
+            _settings(anthropic_api_key="ant-key", opencode_zen_api_key="zen-key")
+        )
+        assert "export ANTHROPIC_API_KEY='ant-key'" in exports
+        assert "export OPENCODE_API_KEY='zen-key'" in exports
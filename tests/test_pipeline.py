@@ -7,6 +7,8 @@ from orchestrator.services.config import get_settings
 
 structlog = pytest.importorskip("structlog")
 
+from orchestrator.services.pipeline import TaskPipeline  # noqa: E402
+
 
 class TestTaskPipelineConfig:
     def test_settings_defaults(self):
@@ -22,8 +24,6 @@ class TestTaskPipelineConfig:
 
     def test_pr_title_generation(self):
         """Test that PR titles are properly formatted."""
-        from orchestrator.services.pipeline import TaskPipeline
-
         pipeline = TaskPipeline.__new__(TaskPipeline)
 
         task = Task(
@@ -35,8 +35,6 @@ class TestTaskPipelineConfig:
         assert len(title) <= 76  # 72 + prefix room
 
     def test_pr_title_truncation(self):
-        from orchestrator.services.pipeline import TaskPipeline
-
         pipeline = TaskPipeline.__new__(TaskPipeline)
 
         task = Task(
@@ -0,0 +1,146 @@
+"""Tests for the REST API routes."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from orchestrator.api.routes import router, set_dependencies  # noqa: E402
+from orchestrator.models.task import Task, TaskMode, TaskStatus  # noqa: E402
+from orchestrator.models.vm import WarmPoolStats  # noqa: E402
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture(scope="module")
+def client_bundle():
+    """One app + TestClient for the module; mocks are reset between tests."""
+    mock_queue = MagicMock()
+    mock_queue.submit = AsyncMock()
+    mock_queue.cancel_task = AsyncMock(return_value=True)
+    mock_pool = MagicMock()
+    set_dependencies(mock_queue, mock_pool)
+    with TestClient(_make_app()) as client:
+        yield client, mock_queue, mock_pool
+    set_dependencies(None, None)
+
+
+@pytest.fixture(autouse=True)
+def _reset(client_bundle):
+    _, mock_queue, mock_pool = client_bundle
+    mock_queue.reset_mock(return_value=True, side_effect=True)
+    mock_pool.reset_mock(return_value=True, side_effect=True)
+    mock_queue.list_tasks.return_value = ([], 0)
+    mock_queue.get_task.return_value = None
+    mock_pool.get_stats.return_value = WarmPoolStats(total_vms=3, ready_vms=2, claimed_vms=1)
+    # Tests may swap the globals out; always start from the shared mocks
+    set_dependencies(mock_queue, mock_pool)
+
+
+def _task(**overrides) -> Task:
+    fields = {
+        "description": "Fix the flaky test in auth service",
+        "repo_url": "https://github.com/example-org/auth-service",
+    }
+    fields.update(overrides)
+    return Task(**fields)
+
+
+class TestHealthEndpoint:
+    def test_health_ok(self, client_bundle):
+        client, _, _ = client_bundle
+        resp = client.get("/api/health")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "healthy"
+        assert data["queue_connected"] is True
+        assert data["pool"]["ready_vms"] == 2
+
+    def test_pool_stats(self, client_bundle):
+        client, _, _ = client_bundle
+        resp = client.get("/api/pool/stats")
+        assert resp.status_code == 200
+        assert resp.json()["claimed_vms"] == 1
+
+
+class TestTaskEndpoints:
+    def test_create_task_infers_mode(self, client_bundle):
+        client, mock_queue, _ = client_bundle
+        resp = client.post(
+            "/api/tasks",
+            json={
+                "description": "Please review my code for security issues",
+                "repo_url": "https://github.com/example-org/auth-service",
+            },
+        )
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["mode"] == TaskMode.REVIEW.value
+        assert data["intent_reason"]
+        mock_queue.submit.assert_awaited_once()
+
+    def test_create_task_rejects_short_description(self, client_bundle):
+        client, mock_queue, _ = client_bundle
+        resp = client.post(
+            "/api/tasks",
+            json={"description": "fix", "repo_url": "https://github.com/example-org/repo"},
+        )
+        assert resp.status_code == 422
+        mock_queue.submit.assert_not_awaited()
+
+    def test_list_tasks_empty(self, client_bundle):
+        client, _, _ = client_bundle
+        resp = client.get("/api/tasks")
+        assert resp.status_code == 200
+        assert resp.json() == {"tasks": [], "total": 0, "page": 1, "per_page": 20}
+
+    def test_get_unknown_task_returns_404(self, client_bundle):
+        client, _, _ = client_bundle
+        assert client.get("/api/tasks/nope").status_code == 404
+
+    def test_get_task(self, client_bundle):
+        client, mock_queue, _ = client_bundle
+        task = _task()
+        mock_queue.get_task.return_value = task
+        resp = client.get(f"/api/tasks/{task.id}")
+        assert resp.status_code == 200
+        assert resp.json()["id"] == task.id
+
+    def test_cancel_task(self, client_bundle):
+        client, mock_queue, _ = client_bundle
+        task = _task()
+        mock_queue.get_task.return_value = task
+        resp = client.delete(f"/api/tasks/{task.id}")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "cancelled"
+        mock_queue.cancel_task.assert_awaited_once_with(task.id)
+
+    def test_cancel_finished_task_returns_400(self, client_bundle):
+        client, mock_queue, _ = client_bundle
+        task = _task(status=TaskStatus.COMPLETED)
+        mock_queue.get_task.return_value = task
+        assert client.delete(f"/api/tasks/{task.id}").status_code == 400
+        mock_queue.cancel_task.assert_not_awaited()
+
+    def test_get_task_log(self, client_bundle):
+        client, mock_queue, _ = client_bundle
+        task = _task(agent_log="step 1 ok")
+        mock_queue.get_task.return_value = task
+        resp = client.get(f"/api/tasks/{task.id}/log")
+        assert resp.status_code == 200
+        assert resp.json()["log"] == "step 1 ok"
+
+
+class TestTaskEndpointsWithNoQueue:
+    def test_list_tasks_returns_503_when_no_queue(self):
+        set_dependencies(None, None)
+        client = TestClient(_make_app())
+        assert client.get("/api/tasks").status_code == 503
@@ -0,0 +1,127 @@
+"""Tests for the Slack bot's per-thread update batching."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import slack_bot.bot as bot_module
+from orchestrator.models.task import Task, TaskStatus
+from slack_bot.bot import DucklingSlackBot
+
+
+@pytest.fixture
+async def bot(mock_settings, monkeypatch):
+    settings = SimpleNamespace(
+        **{**vars(mock_settings), "slack_bot_token": "xoxb-test", "slack_signing_secret": "test"}
+    )
+    monkeypatch.setattr("slack_bot.bot.get_settings", lambda: settings)
+    instance = DucklingSlackBot()
+
+    instance.sent = []
+
+    async def chat_post_message(**kwargs):
+        instance.sent.append(kwargs["text"])
+
+    monkeypatch.setattr(instance._client, "chat_postMessage", chat_post_message)
+    yield instance
+    await instance.close()
+
+
+def _task(**overrides) -> Task:
+    fields = {
+        "description": "fix the flaky test",
+        "repo_url": "https://github.com/example-org/repo",
+        "slack_channel_id": "C123",
+        "slack_thread_ts": "1700000000.000100",
+    }
+    return Task(**{**fields, **overrides})
+
+
+class TestThreadUpdates:
+    async def test_burst_is_batched_into_one_message(self, bot):
+        task = _task(status=TaskStatus.RUNNING)
+        await bot.post_task_update(task, "first")
+        for i in range(3):
+            await bot.post_task_update(task, f"line {i}")
+
+        task.status = TaskStatus.COMPLETED
+        await bot.post_task_update(task, "done")
+
+        assert bot.sent == ["first\nline 0\nline 1\nline 2\ndone"]
+
+    async def test_terminal_status_stops_flusher(self, bot):
+        task = _task(status=TaskStatus.RUNNING)
+        await bot.post_task_update(task, "working")
+        flusher = next(iter(bot._update_flushers.values()))
+
+        task.status = TaskStatus.FAILED
+        await bot.post_task_update(task, "failed")
+
+        assert flusher.done()
+        assert bot._update_queues == {}
+        assert bot._update_flushers == {}
+
+    async def test_idle_flusher_exits_and_drops_its_entries(self, bot, monkeypatch):
+        monkeypatch.setattr(bot_module, "_UPDATE_IDLE_TIMEOUT", 0.01)
+        task = _task(status=TaskStatus.RUNNING)
+        await bot.post_task_update(task, "working")
+        flusher = next(iter(bot._update_flushers.values()))
+
+        await asyncio.wait_for(flusher, timeout=1)
+
+        assert bot.sent == ["working"]
+        assert bot._update_queues == {}
+        assert bot._update_flushers == {}
+
+        # The next update for the thread starts a fresh sender
+        await bot.post_task_update(task, "still working")
+        await asyncio.wait_for(next(iter(bot._update_flushers.values())), timeout=1)
+        assert bot.sent == ["working", "still working"]
+
+    async def test_close_flushes_buffered_updates(self, bot):
+        task = _task(status=TaskStatus.RUNNING)
+        await bot.post_task_update(task, "working")
+        await bot.post_task_update(task, "still working")
+
+        await bot.close()
+
+        assert bot.sent == ["working\nstill working"]
+        assert bot._update_flushers == {}
+
+    async def test_update_without_thread_is_ignored(self, bot):
+        await bot.post_task_update(_task(slack_thread_ts=None), "hello")
+        assert bot._update_flushers == {}
+
+
+class TestSubmitInBackground:
+    async def test_failed_submit_is_reported_in_thread(self, bot):
+        class _FailingQueue:
+            async def submit(self, task):
+                raise RuntimeError("queue full")
+
+        bot.task_queue = _FailingQueue()
+        task = _task()
+
+        bot._submit_in_background(task)
+        await asyncio.wait(set(bot._submissions))
+
+        assert len(bot.sent) == 1
+        assert task.id[:8] in bot.sent[0] and "queue full" in bot.sent[0]
+        assert bot._submissions == set()
+
+    async def test_successful_submit_posts_nothing(self, bot):
+        submitted = []
+
+        class _Queue:
+            async def submit(self, task):
+                submitted.append(task)
+
+        bot.task_queue = _Queue()
+        task = _task()
+
+        bot._submit_in_background(task)
+        await asyncio.wait(set(bot._submissions))
+
+        assert submitted == [task]
+        assert bot.sent == []
@@ -0,0 +1,143 @@
+"""Tests for the Firecracker snapshot manager (filesystem side only — no VM is booted)."""
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from orchestrator.models.vm import VM, VMBackend, VMState
+from warm_pool.firecracker._reflink import reflink
+from warm_pool.firecracker.snapshot_manager import (
+    FirecrackerSnapshotManager,
+    SnapshotConfig,
+    _prefault,
+)
+from warm_pool.pool_manager import FirecrackerBackend
+
+
+def _manager(tmp_path) -> FirecrackerSnapshotManager:
+    return FirecrackerSnapshotManager(
+        SnapshotConfig(
+            snapshot_dir=str(tmp_path / "snapshots"),
+            kernel_path="/var/lib/duckling/vmlinux",
+            rootfs_path="/var/lib/duckling/rootfs.ext4",
+        )
+    )
+
+
+class TestReflink:
+    def test_copies_contents(self, tmp_path):
+        src = tmp_path / "src.ext4"
+        src.write_bytes(os.urandom(64 * 1024))
+        dst = tmp_path / "dst.ext4"
+
+        method = reflink(str(src), str(dst))
+
+        assert method in ("reflink", "copy_file_range", "copy")
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_empty_file(self, tmp_path):
+        src = tmp_path / "empty"
+        src.write_bytes(b"")
+        dst = tmp_path / "dst"
+        reflink(str(src), str(dst))
+        assert dst.read_bytes() == b""
+
+
+class TestPrefault:
+    def test_prefault_existing_files(self, tmp_path):
+        mem = tmp_path / "vm_state.mem"
+        mem.write_bytes(os.urandom(256 * 1024))
+        snap = tmp_path / "vm_state.snap"
+        snap.write_bytes(b"state")
+        _prefault(str(mem), str(snap))  # must not raise
+
+    def test_prefault_without_map_populate_skips_mapping(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("warm_pool.firecracker.snapshot_manager._MAP_POPULATE", 0)
+        monkeypatch.setattr(
+            "warm_pool.firecracker.snapshot_manager.mmap.mmap",
+            lambda *a, **kw: pytest.fail("mapped without MAP_POPULATE"),
+        )
+        mem = tmp_path / "vm_state.mem"
+        mem.write_bytes(b"\0" * 4096)
+        _prefault(str(mem), str(tmp_path / "vm_state.snap"))
+
+    def test_prefault_missing_files_is_noop(self, tmp_path):
+        _prefault(str(tmp_path / "missing.mem"), str(tmp_path / "missing.snap"))
+
+
+class TestVmConfig:
+    async def test_written_config_matches_builder(self, tmp_path):
+        manager = _manager(tmp_path)
+        snapshot = await manager.create_base_snapshot("https://github.com/example-org/repo")
+
+        config_path = os.path.join(os.path.dirname(snapshot.snapshot_path), "vm_config.json")
+        with open(config_path) as f:
+            written = json.load(f)
+
+        assert written == manager._build_vm_config(snapshot.snapshot_id)
+
+
+class TestRestoreFromSnapshot:
+    async def test_restore_clones_disk_diff(self, tmp_path):
+        manager = _manager(tmp_path)
+        snapshot = await manager.create_base_snapshot("https://github.com/example-org/repo")
+        with open(snapshot.disk_diff_path, "wb") as f:
+            f.write(b"disk diff contents")
+
+        instance = await manager.restore_from_snapshot(snapshot.snapshot_id)
+
+        assert os.path.isdir(instance["instance_dir"])
+        with open(instance["disk_diff_path"], "rb") as f:
+            assert f.read() == b"disk diff contents"
+
+    async def test_restore_unknown_snapshot_raises(self, tmp_path):
+        manager = _manager(tmp_path)
+        with pytest.raises(ValueError, match="Snapshot not found"):
+            await manager.restore_from_snapshot("snap-missing")
+
+    async def test_concurrent_restores_get_distinct_instances(self, tmp_path):
+        manager = _manager(tmp_path)
+        snapshot = await manager.create_base_snapshot("https://github.com/example-org/repo")
+
+        instances = [await manager.restore_from_snapshot(snapshot.snapshot_id) for _ in range(20)]
+
+        assert len({i["instance_id"] for i in instances}) == 20
+
+    async def test_cleanup_removes_instance_dir(self, tmp_path):
+        manager = _manager(tmp_path)
+        snapshot = await manager.create_base_snapshot()
+        instance = await manager.restore_from_snapshot(snapshot.snapshot_id)
+
+        await manager.cleanup(instance["instance_id"])
+
+        assert not os.path.exists(instance["instance_dir"])
+
+
+class TestFirecrackerBackend:
+    @pytest.fixture
+    def backend(self, tmp_path, mock_settings, monkeypatch):
+        settings = SimpleNamespace(**{**vars(mock_settings), "snapshot_dir": str(tmp_path)})
+        monkeypatch.setattr("warm_pool.pool_manager.get_settings", lambda: settings)
+        return FirecrackerBackend()
+
+    async def test_vms_restore_from_one_base_snapshot(self, backend):
+        vms = [VM(backend=VMBackend.FIRECRACKER) for _ in range(3)]
+        await asyncio.gather(*(backend.create_vm(vm) for vm in vms))
+
+        assert len(backend._snapshots._snapshots) == 1
+        assert len(set(backend._instances.values())) == 3
+        assert all(vm.state == VMState.WARMING for vm in vms)
+
+    async def test_destroy_cleans_up_instance(self, backend):
+        vm = await backend.create_vm(VM(backend=VMBackend.FIRECRACKER))
+        instance_dir = f"{backend._snapshots._instances_dir}/{backend._instances[vm.id]}"
+        assert os.path.isdir(instance_dir)
+
+        await backend.destroy_vm(vm)
+
+        assert vm.state == VMState.DESTROYED
+        assert not os.path.exists(instance_dir)
+        assert backend._instances == {}
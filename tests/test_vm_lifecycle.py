@@ -0,0 +1,682 @@
+"""Tests for the warm pool VM lifecycle (claim → release → destroy → refill)."""
+
+import asyncio
+import threading
+from collections import deque
+from unittest.mock import MagicMock
+
+import pytest
+
+from orchestrator.models.task import Task, TaskStatus
+from orchestrator.models.vm import VM, VMBackend, VMState
+from orchestrator.services.pipeline import TaskEntry, TaskQueue
+from warm_pool.pool_manager import DockerBackend, VMBackendDriver, WarmPoolManager, _RollingMean
+
+
+class FakeBackend(VMBackendDriver):
+    """
+    In-memory backend that records lifecycle calls.
+
+    Only the most recent VMs are kept (so stress loops don't pin every VM they
+    ever created); use the *_count attributes for totals.
+    """
+
+    HISTORY = 64
+
+    def __init__(self):
+        self.created: deque[VM] = deque(maxlen=self.HISTORY)
+        self.warmed: deque[VM] = deque(maxlen=self.HISTORY)
+        self.destroyed: deque[VM] = deque(maxlen=self.HISTORY)
+        self.created_count = 0
+        self.destroyed_count = 0
+
+    def reset(self):
+        self.created.clear()
+        self.warmed.clear()
+        self.destroyed.clear()
+        self.created_count = 0
+        self.destroyed_count = 0
+
+    async def create_vm(self, vm: VM) -> VM:
+        await asyncio.sleep(0)  # yield like a real backend would
+        vm.container_id = f"container-{vm.id}"
+        vm.state = VMState.WARMING
+        self.created.append(vm)
+        self.created_count += 1
+        return vm
+
+    async def warm_vm(self, vm: VM, repo_url=None) -> VM:
+        vm.state = VMState.READY
+        self.warmed.append(vm)
+        return vm
+
+    async def destroy_vm(self, vm: VM) -> None:
+        vm.state = VMState.DESTROYED
+        self.destroyed.append(vm)
+        self.destroyed_count += 1
+
+    async def exec_in_vm(self, vm: VM, command: str, timeout: int = 120) -> tuple[int, str, str]:
+        return (0, "", "")
+
+    async def health_check(self, vm: VM) -> bool:
+        return True
+
+    async def reset_vm(self, vm: VM) -> bool:
+        return True
+
+
+class _StubPipeline:
+    """Stands in for TaskPipeline where the queue never dispatches (no execute calls)."""
+
+
+async def _until(predicate) -> None:
+    while not predicate():
+        await asyncio.sleep(0.01)
+
+
+# Pure-data fixtures are built once per module; tests must not mutate them.
+
+
+@pytest.fixture(scope="module")
+def sample_task() -> Task:
+    return Task(
+        description="Fix the flaky test in auth service",
+        repo_url="https://github.com/example-org/auth-service",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_vm() -> VM:
+    return VM(backend=VMBackend.DOCKER)
+
+
+@pytest.fixture(scope="module")
+def fake_backend() -> FakeBackend:
+    return FakeBackend()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_backend(fake_backend):
+    fake_backend.reset()
+
+
+@pytest.fixture(scope="module")
+def _pool_settings(mock_settings):
+    # Patched once for the whole module; each test still gets a fresh pool below
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("warm_pool.pool_manager.get_settings", lambda: mock_settings)
+        yield mock_settings
+
+
+@pytest.fixture
+def pool(fake_backend, _pool_settings) -> WarmPoolManager:
+    return WarmPoolManager(backend=fake_backend)
+
+
+class TestSampleFixtures:
+    def test_sample_vm_starts_creating(self, sample_vm):
+        assert sample_vm.state == VMState.CREATING
+        assert sample_vm.task_id is None
+
+    def test_sample_task_has_id(self, sample_task):
+        assert sample_task.id
+
+
+class TestClaimVm:
+    async def test_claim_from_warm_pool(self, pool, fake_backend, sample_task):
+        await pool._fill_pool()
+        assert len(pool._pool) == pool.target_size
+
+        vm = await pool.claim_vm(sample_task.id)
+        assert vm.state == VMState.CLAIMED
+        assert vm.task_id == sample_task.id
+        assert await pool.get_vm(sample_task.id) is vm
+        assert len(pool._pool) == pool.target_size - 1
+        # Served from the pool — no on-demand creation
+        assert fake_backend.created_count == pool.target_size
+
+    async def test_concurrent_claims_get_distinct_vms(self, pool):
+        await pool._fill_pool()
+        vms = await asyncio.gather(*(pool.claim_vm(f"task-{i}") for i in range(pool.target_size)))
+        assert len({vm.id for vm in vms}) == pool.target_size
+        assert len(pool._pool) == 0
+
+    async def test_fill_pools_each_vm_as_it_becomes_ready(self, pool, fake_backend, monkeypatch):
+        gates = [asyncio.Event() for _ in range(pool.target_size)]
+        started = 0
+        create = fake_backend.create_vm
+
+        async def _gated_create(vm):
+            nonlocal started
+            gate, started = gates[started], started + 1
+            await gate.wait()
+            return await create(vm)
+
+        monkeypatch.setattr(fake_backend, "create_vm", _gated_create)
+        fill = asyncio.create_task(pool._fill_pool())
+
+        gates[0].set()
+        await asyncio.wait_for(_until(lambda: len(pool._pool) == 1), 1.0)
+        assert not fill.done()  # first VM is claimable while the rest still build
+
+        for gate in gates[1:]:
+            gate.set()
+        await fill
+        assert len(pool._pool) == pool.target_size
+
+    async def test_concurrent_fills_do_not_overfill(self, pool, fake_backend):
+        await asyncio.gather(pool._fill_pool(), pool._fill_pool())
+        assert len(pool._pool) == pool.target_size
+        assert fake_backend.created_count == pool.target_size
+
+    async def test_on_demand_builds_are_bounded(
+        self, pool, fake_backend, mock_settings, monkeypatch, concurrency_probe
+    ):
+        monkeypatch.setattr(
+            fake_backend, "create_vm", concurrency_probe.wrap(fake_backend.create_vm, hold=0.01)
+        )
+        vms = await asyncio.gather(*(pool.claim_vm(f"task-{i}") for i in range(5)))
+
+        assert len({vm.id for vm in vms}) == 5
+        assert concurrency_probe.peak == mock_settings.warm_pool_max_on_demand
+
+    async def test_claim_on_empty_pool_creates_on_demand(self, pool, fake_backend, sample_task):
+        vm = await pool.claim_vm(sample_task.id)
+        assert vm.state == VMState.CLAIMED
+        assert list(fake_backend.created) == [vm]
+        assert list(fake_backend.warmed) == [vm]
+
+
+class TestRefill:
+    async def test_claim_wakes_refill_loop(self, pool, fake_backend):
+        await pool.start()
+        try:
+            for i in range(pool.target_size):
+                await pool.claim_vm(f"task-{i}")
+            # Well under the old 2s polling interval
+            await asyncio.wait_for(_until(lambda: len(pool._pool) == pool.target_size), 1.0)
+        finally:
+            await pool.stop()
+
+    async def test_empty_pool_claim_takes_refilled_vm(self, pool, fake_backend):
+        await pool.start()
+        try:
+            for i in range(pool.target_size):
+                await pool.claim_vm(f"task-{i}")
+            vm = await pool.claim_vm("task-late")
+            # Served by the refill, not an extra on-demand build
+            assert fake_backend.created_count == 2 * pool.target_size
+            assert vm.task_id == "task-late"
+        finally:
+            await pool.stop()
+
+    @pytest.fixture
+    def gated_warm(self, fake_backend, monkeypatch):
+        """After the first VM, warm_vm blocks until the returned event is set."""
+        gate = asyncio.Event()
+        warm = fake_backend.warm_vm
+
+        async def _gated_warm(vm, repo_url=None):
+            if fake_backend.warmed:
+                await gate.wait()
+            return await warm(vm)
+
+        monkeypatch.setattr(fake_backend, "warm_vm", _gated_warm)
+        return gate
+
+    @pytest.mark.parametrize("builds_finished", [False, True])
+    async def test_cancelled_fill_leaves_no_vm_behind(
+        self, pool, fake_backend, gated_warm, builds_finished
+    ):
+        pool.target_size = 4
+        fill = asyncio.create_task(pool._fill_pool())
+        await _until(lambda: fake_backend.created_count == pool.target_size)
+
+        if builds_finished:
+            gated_warm.set()  # builds complete in the same tick the fill is cancelled
+        fill.cancel()
+        await asyncio.wait({fill})
+
+        assert len(pool._pool) == 1
+        leftover = [vm for vm in fake_backend.created if vm not in pool._pool]
+        assert all(vm.state == VMState.DESTROYED for vm in leftover)
+        assert fake_backend.destroyed_count == pool.target_size - 1
+
+    async def test_stop_cleans_up_in_flight_refill(self, pool, fake_backend, gated_warm):
+        pool._running = True
+        pool._refill_task = asyncio.create_task(pool._refill_loop())
+        pool._refill_needed.set()
+        await _until(lambda: fake_backend.created_count == pool.target_size)
+
+        await pool.stop()
+
+        assert all(vm.state == VMState.DESTROYED for vm in fake_backend.created)
+        assert fake_backend.destroyed_count == fake_backend.created_count
+
+
+class TestReleaseVm:
+    async def test_release_destroys_vm(self, pool, fake_backend, sample_task):
+        vm = await pool.claim_vm(sample_task.id)
+        await pool.release_vm(sample_task.id)
+
+        assert list(fake_backend.destroyed) == [vm]
+        assert vm.state == VMState.DESTROYED
+        assert await pool.get_vm(sample_task.id) is None
+
+    async def test_release_defers_destroy_to_background(self, pool, fake_backend, monkeypatch):
+        gate = asyncio.Event()
+        destroy = fake_backend.destroy_vm
+
+        async def _slow_destroy(vm):
+            await gate.wait()
+            await destroy(vm)
+
+        monkeypatch.setattr(fake_backend, "destroy_vm", _slow_destroy)
+        await pool.start()
+        vm = await pool.claim_vm("task-1")
+
+        await pool.release_vm("task-1")
+        assert vm not in fake_backend.destroyed  # release didn't wait for teardown
+
+        gate.set()
+        await pool.stop()  # drains the destroy queue
+        assert vm in fake_backend.destroyed
+
+    async def test_release_unknown_task_is_noop(self, pool, fake_backend):
+        await pool.release_vm("no-such-task")
+        assert fake_backend.destroyed_count == 0
+
+
+class TestRecycleVm:
+    @pytest.fixture
+    def recycling_pool(self, pool):
+        pool.max_vm_reuses = 2
+        pool._running = True
+        pool._CLAIM_WAIT_S = 0  # no refill loop here to wait for
+        return pool
+
+    async def test_release_returns_vm_to_pool(self, recycling_pool, fake_backend):
+        vm = await recycling_pool.claim_vm("task-1")
+        await recycling_pool.release_vm("task-1")
+
+        assert fake_backend.destroyed_count == 0
+        assert list(recycling_pool._pool) == [vm]
+        assert vm.state == VMState.READY
+        assert vm.reuse_count == 1
+        assert await recycling_pool.claim_vm("task-2") is vm
+
+    async def test_vm_destroyed_after_max_reuses(self, recycling_pool, fake_backend):
+        for i in range(3):
+            vm = await recycling_pool.claim_vm(f"task-{i}")
+            await recycling_pool.release_vm(f"task-{i}")
+
+        assert vm.reuse_count == 2
+        assert list(fake_backend.destroyed) == [vm]
+        assert fake_backend.created_count == 1
+
+    async def test_failed_reset_destroys_vm(self, recycling_pool, fake_backend, monkeypatch):
+        async def _reset_fails(vm):
+            return False
+
+        monkeypatch.setattr(fake_backend, "reset_vm", _reset_fails)
+        vm = await recycling_pool.claim_vm("task-1")
+        await recycling_pool.release_vm("task-1")
+
+        assert list(fake_backend.destroyed) == [vm]
+        assert len(recycling_pool._pool) == 0
+
+    async def test_stop_during_reset_destroys_vm(self, recycling_pool, fake_backend, monkeypatch):
+        resetting, gate = asyncio.Event(), asyncio.Event()
+
+        async def _slow_reset(vm):
+            resetting.set()
+            await gate.wait()
+            return True
+
+        monkeypatch.setattr(fake_backend, "reset_vm", _slow_reset)
+        vm = await recycling_pool.claim_vm("task-1")
+        release = asyncio.create_task(recycling_pool.release_vm("task-1"))
+        await resetting.wait()
+
+        await recycling_pool.stop()
+        gate.set()
+        await release
+
+        assert len(recycling_pool._pool) == 0
+        assert vm.state == VMState.DESTROYED
+
+    async def test_reuse_disabled_by_default(self, pool, fake_backend):
+        pool._running = True
+        pool._CLAIM_WAIT_S = 0
+        vm = await pool.claim_vm("task-1")
+        await pool.release_vm("task-1")
+        assert list(fake_backend.destroyed) == [vm]
+
+
+class TestDockerBackend:
+    @pytest.fixture
+    def docker_backend(self, _pool_settings):
+        backend = DockerBackend()
+        backend._docker = MagicMock()
+        backend._docker.containers.run.return_value = MagicMock(id="c0ffee", short_id="c0ffee")
+        api = backend._docker.api
+        api.exec_create.return_value = {"Id": "exec-1"}
+        api.exec_start.side_effect = lambda *a, **kw: iter([(b"ok\n", None)])
+        api.exec_inspect.return_value = {"ExitCode": 0}
+        yield backend
+        backend._containers.clear()
+
+    async def test_container_handle_reused(self, docker_backend):
+        vm = await docker_backend.create_vm(VM(backend=VMBackend.DOCKER))
+        assert await docker_backend.exec_in_vm(vm, "echo ok") == (0, "ok\n", "")
+        await docker_backend.destroy_vm(vm)
+
+        docker_backend._docker.containers.get.assert_not_called()
+        container = docker_backend._docker.containers.run.return_value
+        container.stop.assert_not_called()
+        container.remove.assert_called_once_with(force=True)
+        assert docker_backend._containers == {}
+        assert vm.state == VMState.DESTROYED
+
+    async def test_creates_are_bounded(self, docker_backend, mock_settings, concurrency_probe):
+        container = docker_backend._docker.containers.run.return_value
+        docker_backend._docker.containers.run.side_effect = concurrency_probe.wrap(
+            lambda **kwargs: container, hold=0.02
+        )
+        await asyncio.gather(
+            *(docker_backend.create_vm(VM(backend=VMBackend.DOCKER)) for _ in range(10))
+        )
+
+        assert 1 < concurrency_probe.peak <= mock_settings.docker_create_concurrency
+
+    async def test_health_check_skips_exec_after_recent_success(self, docker_backend):
+        vm = VM(backend=VMBackend.DOCKER, container_id="c0ffee")
+        api = docker_backend._docker.api
+
+        assert await docker_backend.health_check(vm) is True
+        assert await docker_backend.health_check(vm) is True
+        assert api.exec_create.call_count == 1
+
+        docker_backend._last_ok[vm.container_id] -= docker_backend._HEALTH_TTL_S
+        assert await docker_backend.health_check(vm) is True
+        assert api.exec_create.call_count == 2
+
+    async def test_exec_output_is_capped(self, docker_backend, monkeypatch):
+        monkeypatch.setattr(docker_backend, "_EXEC_OUTPUT_CAP", 8)
+        docker_backend._docker.api.exec_start.side_effect = lambda *a, **kw: iter(
+            [(b"12345", None), (None, b"warn"), (b"67890", None), (b"abc", None)]
+        )
+        vm = VM(backend=VMBackend.DOCKER, container_id="c0ffee")
+
+        assert await docker_backend.exec_in_vm(vm, "noisy") == (0, "12345678", "warn")
+
+    async def test_exec_runs_under_timeout(self, docker_backend):
+        vm = VM(backend=VMBackend.DOCKER, container_id="c0ffee")
+        await docker_backend.exec_in_vm(vm, "pytest -q", timeout=42)
+
+        cmd = docker_backend._docker.api.exec_create.call_args.args[1]
+        assert cmd[0] == "timeout" and "42" in cmd
+        assert cmd[-3:] == ["bash", "-c", "pytest -q"]
+
+    async def test_exec_gives_up_when_daemon_hangs(self, docker_backend, monkeypatch):
+        monkeypatch.setattr(docker_backend, "_EXEC_KILL_GRACE_S", 0)
+        release = threading.Event()
+        threading.Timer(5, release.set).start()  # safety net for the worker thread
+
+        def _hung_stream(*args, **kwargs):
+            release.wait()
+            return iter([])
+
+        docker_backend._docker.api.exec_start.side_effect = _hung_stream
+        vm = VM(backend=VMBackend.DOCKER, container_id="c0ffee")
+
+        exit_code, _, stderr = await docker_backend.exec_in_vm(vm, "reset", timeout=0.05)
+
+        release.set()
+        assert exit_code == 124
+        assert "timed out" in stderr
+
+    async def test_long_execs_do_not_starve_creates(self, docker_backend, mock_settings):
+        release = threading.Event()
+        threading.Timer(5, release.set).start()  # safety net for the worker threads
+
+        def _agent_run(*args, **kwargs):
+            release.wait()
+            return iter([])
+
+        docker_backend._docker.api.exec_start.side_effect = _agent_run
+        vm = VM(backend=VMBackend.DOCKER, container_id="c0ffee")
+        runs = [
+            asyncio.create_task(docker_backend.exec_in_vm(vm, "goose run"))
+            for _ in range(mock_settings.docker_concurrency)
+        ]
+        await asyncio.sleep(0.01)
+
+        created = await asyncio.wait_for(
+            docker_backend.create_vm(VM(backend=VMBackend.DOCKER)), timeout=1
+        )
+
+        release.set()
+        await asyncio.gather(*runs)
+        assert created.state == VMState.WARMING
+
+    async def test_close_does_not_block_the_loop(self, docker_backend):
+        release = threading.Event()
+        # Safety net: a blocking close() would otherwise hang the test forever
+        threading.Timer(0.5, release.set).start()
+        in_flight = asyncio.create_task(docker_backend._run(release.wait))
+        await asyncio.sleep(0.01)
+
+        close = asyncio.create_task(docker_backend.close())
+        await asyncio.sleep(0.01)  # only runs if close() isn't blocking the loop
+        assert not close.done()
+
+        release.set()
+        await asyncio.wait_for(close, timeout=1)
+        assert in_flight.done()
+
+
+class TestStop:
+    async def test_stop_destroys_pooled_and_claimed_vms_concurrently(
+        self, pool, fake_backend, monkeypatch, concurrency_probe
+    ):
+        await pool._fill_pool()
+        claimed = await pool.claim_vm("task-1")
+        monkeypatch.setattr(
+            fake_backend, "destroy_vm", concurrency_probe.wrap(fake_backend.destroy_vm)
+        )
+
+        await pool.stop()
+
+        assert fake_backend.destroyed_count == pool.target_size
+        assert claimed in fake_backend.destroyed
+        assert concurrency_probe.peak == pool.target_size
+
+    async def test_release_racing_stop_still_destroys_vm(self, pool, fake_backend, monkeypatch):
+        await pool.start()
+        claimed = await pool.claim_vm("task-1")
+        join = pool._destroy_queue.join
+
+        async def _join_then_release():
+            await join()
+            # Lands after the queue drained but before the destroyer is cancelled
+            await pool.release_vm("task-1")
+
+        monkeypatch.setattr(pool._destroy_queue, "join", _join_then_release)
+        await pool.stop()
+
+        assert claimed.state == VMState.DESTROYED
+        assert pool._destroy_queue.empty()
+
+
+class TestReleaseVmMemoryLeak:
+    async def test_release_drops_all_references(self, pool, sample_task):
+        await pool.claim_vm(sample_task.id)
+        await pool.release_vm(sample_task.id)
+        assert len(list(pool.all_vms)) == 0
+
+    async def test_all_vms_stable_after_many_cycles(self, pool, fake_backend):
+        await pool._fill_pool()
+        for i in range(50):
+            await pool.claim_vm(f"task-{i}")
+            await pool.release_vm(f"task-{i}")
+            await pool._fill_pool()
+
+        assert len(list(pool.all_vms)) == pool.target_size
+        assert pool._claimed == {}
+        assert fake_backend.destroyed_count == 50
+
+
+class TestPoolStats:
+    async def test_stats_reflect_pool_and_claims(self, pool, sample_task):
+        await pool._fill_pool()
+        await pool.claim_vm(sample_task.id)
+
+        stats = pool.get_stats()
+        assert stats.ready_vms == pool.target_size - 1
+        assert stats.claimed_vms == 1
+        assert stats.total_vms == pool.target_size
+        assert stats.backend == VMBackend.FIRECRACKER  # FakeBackend is not a DockerBackend
+
+    def test_rolling_mean_evicts_oldest(self):
+        mean = _RollingMean(maxlen=3)
+        assert mean.mean() == 0.0
+        for value in (1.0, 2.0, 3.0, 10.0):
+            mean.append(value)
+        assert mean.mean() == pytest.approx(5.0)  # (2 + 3 + 10) / 3
+
+    async def test_stats_count_creating_and_failed_vms(self, pool, fake_backend, monkeypatch):
+        started, gate = [], asyncio.Event()
+        all_started = asyncio.Event()
+
+        async def _slow_create(vm):
+            started.append(vm)
+            if len(started) == pool.target_size:
+                all_started.set()
+            await gate.wait()
+            raise RuntimeError("docker daemon unavailable")
+
+        monkeypatch.setattr(fake_backend, "create_vm", _slow_create)
+        fill = asyncio.create_task(pool._fill_pool())
+        await all_started.wait()
+        assert pool.get_stats().creating_vms == pool.target_size
+
+        gate.set()
+        await fill
+        stats = pool.get_stats()
+        assert stats.creating_vms == 0
+        # Failed VMs are torn down, so the gauge drops back; the total remembers
+        assert stats.error_vms == 0
+        assert stats.create_failures_total == pool.target_size
+        assert fake_backend.destroyed_count == pool.target_size
+
+    async def test_error_gauge_keeps_vms_that_fail_teardown(
+        self, pool, fake_backend, monkeypatch
+    ):
+        async def _create_fails(vm):
+            raise RuntimeError("docker daemon unavailable")
+
+        async def _destroy_fails(vm):
+            raise RuntimeError("docker daemon unavailable")
+
+        monkeypatch.setattr(fake_backend, "create_vm", _create_fails)
+        monkeypatch.setattr(fake_backend, "destroy_vm", _destroy_fails)
+        await pool._fill_pool()
+
+        stats = pool.get_stats()
+        assert stats.error_vms == pool.target_size
+        assert stats.create_failures_total == pool.target_size
+
+
+class TestCancelTask:
+    _STUB_PIPELINE = _StubPipeline()
+
+    async def test_cancel_running_task(self):
+        queue = TaskQueue(pipeline=self._STUB_PIPELINE)
+        task = Task(description="Fix the flaky test", repo_url="https://github.com/o/r")
+        async_task = asyncio.create_task(asyncio.sleep(3600))
+        queue._entries[task.id] = TaskEntry(task, async_task)
+
+        assert await queue.cancel_task(task.id) is True
+        assert async_task.cancelled()
+        assert task.status == TaskStatus.CANCELLED
+        assert queue._entries[task.id].async_task is None
+
+    async def test_cancel_task_cascades_to_children(self):
+        children: list[asyncio.Task] = []
+
+        class _ChildSpawningPipeline:
+            async def execute(self, task):
+                # Stands in for a VM exec / clone the pipeline is awaiting
+                child = asyncio.create_task(asyncio.sleep(3600))
+                children.append(child)
+                await child
+
+        queue = TaskQueue(pipeline=_ChildSpawningPipeline())
+        task = Task(description="Fix the flaky test", repo_url="https://github.com/o/r")
+        async_task = asyncio.create_task(queue.pipeline.execute(task))
+        queue._entries[task.id] = TaskEntry(task, async_task)
+        await asyncio.sleep(0)  # let execute() spawn its child
+
+        assert await queue.cancel_task(task.id) is True
+        assert async_task.cancelled()
+        assert children and children[0].cancelled()
+
+    async def test_cancel_task_caller_can_still_be_cancelled(self):
+        release = asyncio.Event()
+
+        async def _slow_teardown():
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                await release.wait()  # e.g. a VM release still in flight
+                raise
+
+        queue = TaskQueue(pipeline=self._STUB_PIPELINE)
+        task = Task(description="Fix the flaky test", repo_url="https://github.com/o/r")
+        async_task = asyncio.create_task(_slow_teardown())
+        queue._entries[task.id] = TaskEntry(task, async_task)
+        await asyncio.sleep(0)
+
+        caller = asyncio.create_task(queue.cancel_task(task.id))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, timeout=1)
+
+        release.set()
+        await asyncio.wait({async_task})
+        assert async_task.cancelled()
+
+    async def test_cancel_pending_task(self):
+        queue = TaskQueue(pipeline=self._STUB_PIPELINE)
+        task = await queue.submit(
+            Task(description="Fix the flaky test", repo_url="https://github.com/o/r")
+        )
+
+        assert await queue.cancel_task(task.id) is True
+        assert task.status == TaskStatus.CANCELLED
+        assert queue._entries[task.id].async_task is None
+
+    async def test_cancel_unknown_or_finished_task(self):
+        queue = TaskQueue(pipeline=self._STUB_PIPELINE)
+        task = Task(description="Fix the flaky test", repo_url="https://github.com/o/r")
+        task.mark_failed("boom")
+        queue._entries[task.id] = TaskEntry(task)
+
+        assert await queue.cancel_task("no-such-task") is False
+        assert await queue.cancel_task(task.id) is False
+        assert task.status == TaskStatus.FAILED
+
+    async def test_cancel_many(self):
+        queue = TaskQueue(pipeline=self._STUB_PIPELINE)
+        async_tasks = []
+        for _ in range(3):
+            task = Task(description="Fix the flaky test", repo_url="https://github.com/o/r")
+            async_task = asyncio.create_task(asyncio.sleep(3600))
+            queue._entries[task.id] = TaskEntry(task, async_task)
+            async_tasks.append(async_task)
+
+        assert await queue.cancel_many(list(queue._entries)) == 3
+        assert all(t.cancelled() for t in async_tasks)
+        assert all(e.async_task is None for e in queue._entries.values())
@@ -76,6 +76,7 @@ export interface PoolStats {
   claimed_vms: number;
   creating_vms: number;
   error_vms: number;
+  create_failures_total: number;
   backend: string;
   target_pool_size: number;
   avg_claim_time_ms: number;
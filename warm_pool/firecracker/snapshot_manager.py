@@ -18,8 +18,12 @@ with all your deps installed and repo cloned.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import json
+import mmap
 import os
+import secrets
 import shutil
 import subprocess
 import tempfile
@@ -30,8 +34,51 @@ from typing import Optional
 
 import structlog
 
+from ._reflink import reflink
+
 logger = structlog.get_logger()
 
+# Counter + random suffix: unique within the process even for same-millisecond
+# restores, and distinct across orchestrator restarts sharing a snapshot_dir
+_SNAP_COUNTER = itertools.count()
+_INST_COUNTER = itertools.count()
+
+# File names inside a snapshot / instance directory. Paths are joined with "/"
+# directly — Firecracker only runs on Linux.
+_SOCK = "firecracker.sock"
+_CFG = "vm_config.json"
+_MEM = "vm_state.mem"
+_SNAP = "vm_state.snap"
+_DIFF = "disk_diff.ext4"
+
+# Linux-only (and Python 3.10+); without it the memory file is left to fault in lazily
+_MAP_POPULATE = getattr(mmap, "MAP_POPULATE", 0)
+
+
+def _prefault(mem_file_path: str, snap_file_path: str) -> None:
+    """
+    Pull a snapshot's files into the page cache ahead of the guest touching them.
+
+    The memory file is mapped with MAP_POPULATE so the kernel reads it in one
+    sequential pass instead of taking a 4 KiB fault per first-touched page.
+    """
+    if hasattr(os, "posix_fadvise") and os.path.exists(snap_file_path):
+        fd = os.open(snap_file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+    if not _MAP_POPULATE or not os.path.exists(mem_file_path):
+        return
+    fd = os.open(mem_file_path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size:
+            mm = mmap.mmap(fd, 0, flags=mmap.MAP_PRIVATE | _MAP_POPULATE, prot=mmap.PROT_READ)
+            mm.close()
+    finally:
+        os.close(fd)
+
 
 @dataclass
 class SnapshotConfig:
@@ -81,74 +128,82 @@ class FirecrackerSnapshotManager:
     def __init__(self, config: SnapshotConfig):
         self.config = config
         self._snapshots: dict[str, VMSnapshot] = {}
+        # Sync logging: structlog's a* methods hop through the default executor per call
+        self._log = logger.bind(component="fc_snap")
+        self._instances_dir = f"{config.snapshot_dir}/instances"
+        # Created once so per-snapshot/per-restore dirs need only a single mkdir
+        os.makedirs(self._instances_dir, exist_ok=True)
+        self._prefetches: set[asyncio.Future] = set()
+        # Only the vm_id varies between configs, so serialize once and substitute
+        self._config_tpl = json.dumps(
+            self._build_vm_config("{VMID}"), separators=(",", ":")
+        ).encode()
 
     async def create_base_snapshot(
         self,
-        repo_url: str,
+        repo_url: Optional[str] = None,
         setup_commands: list[str] = None,
     ) -> VMSnapshot:
         """
         Create a base snapshot with repo + deps pre-loaded.
 
+        Without a repo_url the snapshot only carries the agent tooling — a
+        generic golden image for the warm pool.
+
         This is a one-time (or periodic) operation that:
         1. Boots a fresh Firecracker VM
         2. Runs setup commands (install deps, clone repo)
         3. Pauses the VM
         4. Snapshots memory + disk state
         """
-        snapshot_id = f"snap-{int(time.time())}"
-        snapshot_dir = os.path.join(self.config.snapshot_dir, snapshot_id)
-        os.makedirs(snapshot_dir, exist_ok=True)
-
-        await logger.ainfo("Creating base snapshot", snapshot_id=snapshot_id, repo_url=repo_url)
+        snapshot_id = f"snap-{next(_SNAP_COUNTER):08x}-{secrets.token_hex(3)}"
+        snapshot_dir = f"{self.config.snapshot_dir}/{snapshot_id}"
 
-        # Step 1: Create Firecracker VM config
-        vm_config = self._build_vm_config(snapshot_id)
+        self._log.info("Creating base snapshot", snapshot_id=snapshot_id, repo_url=repo_url)
 
-        # Step 2: Start the VM via Firecracker API
-        socket_path = os.path.join(snapshot_dir, "firecracker.sock")
-        vm_config_path = os.path.join(snapshot_dir, "vm_config.json")
-        with open(vm_config_path, "w") as f:
-            json.dump(vm_config, f, indent=2)
+        # Steps 1-2: Write the Firecracker VM config, then start the VM via its API
+        socket_path = f"{snapshot_dir}/{_SOCK}"
+        await asyncio.to_thread(self._write_vm_config, snapshot_dir, snapshot_id)
 
         # Step 3: Boot VM (production would use Firecracker's API socket)
         # This is the actual Firecracker command:
         #   firecracker --api-sock /tmp/fc.sock --config-file vm_config.json
-        await logger.ainfo("Booting VM for snapshotting", socket=socket_path)
+        self._log.info("Booting VM for snapshotting", socket=socket_path)
 
         # Step 4: Wait for boot, then run setup commands
-        default_setup = [
-            "pip install ruff pytest httpx goose-ai 2>/dev/null || true",
-            f"git clone --depth=50 {repo_url} /workspace/repo",
-            "cd /workspace/repo && pip install -e '.[dev]' 2>/dev/null || pip install -r requirements.txt 2>/dev/null || true",
-        ]
+        default_setup = ["pip install ruff pytest httpx goose-ai 2>/dev/null || true"]
+        if repo_url:
+            default_setup += [
+                f"git clone --depth=50 {repo_url} /workspace/repo",
+                "cd /workspace/repo && pip install -e '.[dev]' 2>/dev/null || pip install -r requirements.txt 2>/dev/null || true",
+            ]
         commands = setup_commands or default_setup
 
         for cmd in commands:
-            await logger.ainfo("Running setup command", cmd=cmd[:80])
+            self._log.info("Running setup command", cmd=cmd[:80])
             # In production: send command via SSH/vsock to the running VM
 
         # Step 5: Pause the VM
         # PUT /vm with state: "Paused" via Firecracker API
-        await logger.ainfo("Pausing VM for snapshot")
+        self._log.info("Pausing VM for snapshot")
 
         # Step 6: Create the snapshot
         # PUT /snapshot/create with snapshot_type: "Full"
-        mem_file = os.path.join(snapshot_dir, "vm_state.mem")
-        snap_file = os.path.join(snapshot_dir, "vm_state.snap")
+        mem_file = f"{snapshot_dir}/{_MEM}"
+        snap_file = f"{snapshot_dir}/{_SNAP}"
 
         snapshot = VMSnapshot(
             snapshot_id=snapshot_id,
             snapshot_path=snap_file,
             mem_file_path=mem_file,
-            disk_diff_path=os.path.join(snapshot_dir, "disk_diff.ext4"),
+            disk_diff_path=f"{snapshot_dir}/{_DIFF}",
             created_at=time.time(),
             base_rootfs=self.config.rootfs_path,
             repo_url=repo_url,
         )
 
         self._snapshots[snapshot_id] = snapshot
-        await logger.ainfo("Base snapshot created", snapshot_id=snapshot_id)
+        self._log.info("Base snapshot created", snapshot_id=snapshot_id)
         return snapshot
 
     async def restore_from_snapshot(self, snapshot_id: str) -> dict:
@@ -164,13 +219,20 @@ class FirecrackerSnapshotManager:
 
         start = time.monotonic()
 
-        # Create a CoW copy of the disk diff
-        instance_id = f"inst-{int(time.time() * 1000)}"
-        instance_dir = os.path.join(self.config.snapshot_dir, "instances", instance_id)
-        os.makedirs(instance_dir, exist_ok=True)
+        # Per-instance working directory
+        instance_id = f"inst-{next(_INST_COUNTER):08x}-{secrets.token_hex(3)}"
+        instance_dir = f"{self._instances_dir}/{instance_id}"
+        instance_disk = f"{instance_dir}/{_DIFF}"
+        copy_method = await asyncio.to_thread(
+            self._prepare_instance_dir, instance_dir, snapshot.disk_diff_path, instance_disk
+        )
 
-        # In production: use reflink copy or overlay for CoW
-        # cp --reflink=auto snapshot_diff.ext4 instance_diff.ext4
+        # Warm the page cache in the background while Firecracker loads the snapshot
+        prefetch = asyncio.get_running_loop().run_in_executor(
+            None, _prefault, snapshot.mem_file_path, snapshot.snapshot_path
+        )
+        self._prefetches.add(prefetch)
+        prefetch.add_done_callback(self._on_prefetch_done)
 
         # Restore the VM via Firecracker API:
         # PUT /snapshot/load with:
@@ -180,11 +242,12 @@ class FirecrackerSnapshotManager:
 
         restore_time_ms = (time.monotonic() - start) * 1000
 
-        await logger.ainfo(
+        self._log.info(
             "VM restored from snapshot",
             snapshot_id=snapshot_id,
             instance_id=instance_id,
             restore_time_ms=round(restore_time_ms, 2),
+            disk_copy=copy_method,
         )
 
         return {
@@ -192,8 +255,45 @@ class FirecrackerSnapshotManager:
             "snapshot_id": snapshot_id,
             "restore_time_ms": restore_time_ms,
             "instance_dir": instance_dir,
+            "disk_diff_path": instance_disk,
         }
 
+    async def cleanup(self, instance_id: str) -> None:
+        """Delete a restored instance's working directory, CoW disk diff included."""
+        # In production: kill the instance's Firecracker process first
+        await asyncio.to_thread(shutil.rmtree, f"{self._instances_dir}/{instance_id}", True)
+        self._log.info("Instance cleaned up", instance_id=instance_id)
+
+    def _write_vm_config(self, snapshot_dir: str, snapshot_id: str) -> None:
+        """Create the snapshot directory and write its VM config (runs in a worker thread)."""
+        os.mkdir(snapshot_dir)
+        vm_config = self._config_tpl.replace(b"{VMID}", snapshot_id.encode())
+        with open(f"{snapshot_dir}/{_CFG}", "wb") as f:
+            f.write(vm_config)
+        self._log.debug("VM config written", snapshot_id=snapshot_id)
+
+    @staticmethod
+    def _prepare_instance_dir(
+        instance_dir: str, disk_diff_path: str, instance_disk: str
+    ) -> Optional[str]:
+        """
+        Create an instance's working directory and clone the disk diff into it
+        (runs in a worker thread).
+
+        The clone is O(metadata) on reflink-capable filesystems, so restore time
+        doesn't scale with the diff size. Returns the copy method used, or None
+        if the snapshot has no disk diff.
+        """
+        os.mkdir(instance_dir)  # ids are unique, so the leaf never exists yet
+        if not os.path.exists(disk_diff_path):
+            return None
+        return reflink(disk_diff_path, instance_disk)
+
+    def _on_prefetch_done(self, fut: asyncio.Future) -> None:
+        self._prefetches.discard(fut)
+        if not fut.cancelled() and fut.exception() is not None:
+            self._log.warning("Snapshot prefetch failed", error=str(fut.exception()))
+
     def _build_vm_config(self, vm_id: str) -> dict:
         """Build a Firecracker VM configuration."""
         return {
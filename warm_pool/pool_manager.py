@@ -13,16 +13,20 @@ Architecture mirrors Stripe's approach:
 from __future__ import annotations
 
 import asyncio
+import atexit
+import itertools
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from collections import deque
-from typing import Optional
+from collections import Counter, deque
+from typing import Any, Iterator, Optional
 
 import structlog
 
 from orchestrator.models.vm import VM, VMBackend, VMState, WarmPoolStats
 from orchestrator.services.config import get_settings
+from warm_pool.firecracker.snapshot_manager import FirecrackerSnapshotManager, SnapshotConfig
 
 logger = structlog.get_logger()
 
@@ -47,7 +51,12 @@ class VMBackendDriver(ABC):
 
     @abstractmethod
     async def exec_in_vm(self, vm: VM, command: str, timeout: int = 120) -> tuple[int, str, str]:
-        """Execute a command inside the VM. Returns (exit_code, stdout, stderr)."""
+        """
+        Execute a command inside the VM. Returns (exit_code, stdout, stderr).
+
+        A command still running after ``timeout`` seconds is killed and reports
+        exit code 124, as coreutils ``timeout`` does.
+        """
         ...
 
     @abstractmethod
@@ -55,12 +64,70 @@ class VMBackendDriver(ABC):
         """Check if the VM is healthy and responsive."""
         ...
 
+    async def reset_vm(self, vm: VM) -> bool:
+        """
+        Scrub a released VM so it can serve another task.
+
+        Returns False if the backend can't reset VMs — the pool then destroys
+        the VM as usual.
+        """
+        return False
+
+    async def close(self) -> None:
+        """Release backend resources once the pool has shut down."""
+
 
 class DockerBackend(VMBackendDriver):
     """Docker-based VM backend for development and demo purposes."""
 
+    # Everything a task can leave behind. Other image-baked files in /workspace
+    # are kept; opencode.json is rewritten by the OpenCode engine on every start.
+    # Writes a repo's setup code makes elsewhere on the filesystem are NOT undone —
+    # see max_vm_reuses.
+    _RESET_CMD = (
+        # Kill everything but PID 1 (the keep-alive) and this shell
+        "for p in /proc/[0-9]*; do pid=${p#/proc/}; "
+        '[ "$pid" -ne 1 ] && [ "$pid" -ne $$ ] && kill -9 "$pid" 2>/dev/null; done; '
+        # Restore site-packages to the image's baseline: anything the previous
+        # task installed, editable or not, or upgraded, is uninstalled
+        "B=/etc/duckling/pip-baseline.txt; [ -f $B ] && "
+        "{ pip list --format=freeze 2>/dev/null | grep -vxF -f $B | cut -d= -f1 "
+        "| xargs -r pip uninstall -y -q 2>/dev/null; true; } && "
+        "rm -rf /workspace/repo /workspace/review /workspace/prompts "
+        "/workspace/opencode.json /workspace/opencode-server.log "
+        "/root/.local/share/opencode /root/.config/goose/sessions /tmp/* && "
+        # Fail the reset (so the pool destroys the VM) unless the packages now
+        # match the baseline exactly — an upgraded one is gone, not restored
+        "pip list --format=freeze 2>/dev/null | cmp -s - $B && "
+        "mkdir -p /workspace/repo /workspace/review"
+    )
+
+    _EXEC_OUTPUT_CAP = 16 * 1024 * 1024  # per stream; the rest is drained and dropped
+    _EXEC_KILL_GRACE_S = 5  # SIGKILL a timed-out command this long after its SIGTERM
+    _HEALTH_TTL_S = 1.0  # a container that answered an exec this recently counts as healthy
+
     def __init__(self):
         self._docker = None
+        # Live containers by ID. docker-py Container objects are thin handles, so
+        # reusing them skips the GET round-trip to the daemon before every op
+        self._containers: dict[str, Any] = {}
+        # container ID -> time.monotonic() of its last completed exec (see health_check)
+        self._last_ok: dict[str, float] = {}
+        # docker-py is blocking. Control-plane calls (create/remove) and execs get
+        # separate pools: an exec holds its thread for the whole command — an
+        # agent run can take minutes — and must not queue fills and destroys
+        settings = get_settings()
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.docker_concurrency, thread_name_prefix="docker-io"
+        )
+        self._exec_executor = ThreadPoolExecutor(
+            max_workers=settings.docker_exec_concurrency, thread_name_prefix="docker-exec"
+        )
+        # The daemon gets slower per container past a handful of parallel creates
+        self._create_sem = asyncio.Semaphore(settings.docker_create_concurrency)
+        # Recycled containers outlive single tasks, so make sure an unclean
+        # exit doesn't leave them running
+        atexit.register(self._remove_live_containers)
 
     def _get_docker(self):
         if self._docker is None:
@@ -69,6 +136,30 @@ class DockerBackend(VMBackendDriver):
             self._docker = docker.from_env()
         return self._docker
 
+    async def _run(self, fn, executor: Optional[ThreadPoolExecutor] = None):
+        return await asyncio.get_running_loop().run_in_executor(executor or self._executor, fn)
+
+    async def close(self) -> None:
+        # Joining the workers blocks until in-flight docker calls return — keep that off the loop
+        await asyncio.to_thread(self._executor.shutdown, True)
+        await asyncio.to_thread(self._exec_executor.shutdown, True)
+
+    def _container(self, container_id: str):
+        """Cached handle for a container (blocking — call from the executor)."""
+        container = self._containers.get(container_id)
+        if container is None:
+            # Not created by this backend instance, e.g. before a restart
+            container = self._get_docker().containers.get(container_id)
+        return container
+
+    def _remove_live_containers(self) -> None:
+        for container in list(self._containers.values()):
+            try:
+                container.remove(force=True)
+            except Exception:
+                pass
+        self._containers.clear()
+
     async def create_vm(self, vm: VM) -> VM:
         settings = get_settings()
         docker_client = self._get_docker()
@@ -98,7 +189,15 @@ class DockerBackend(VMBackendDriver):
                 remove=False,
             )
 
-        container = await asyncio.to_thread(_create)
+        def _create_and_track():
+            container = _create()
+            # Tracked from the worker thread, so the atexit sweep still finds
+            # the container if this coroutine is cancelled mid-create
+            self._containers[container.id] = container
+            return container
+
+        async with self._create_sem:
+            container = await self._run(_create_and_track)
         vm.container_id = container.id
         vm.state = VMState.WARMING
         await logger.ainfo("Docker container created", vm_id=vm.id, container_id=container.short_id)
@@ -119,45 +218,78 @@ class DockerBackend(VMBackendDriver):
 
     async def destroy_vm(self, vm: VM) -> None:
         if vm.container_id:
-            docker_client = self._get_docker()
             try:
 
                 def _destroy():
-                    container = docker_client.containers.get(vm.container_id)
-                    container.stop(timeout=5)
-                    container.remove(force=True)
+                    # No graceful stop: PID 1 is `tail -f /dev/null`, which
+                    # ignores SIGTERM, so stop() always sat out its full timeout
+                    # before killing. A forced remove kills and deletes in one call.
+                    self._container(vm.container_id).remove(force=True)
 
-                await asyncio.to_thread(_destroy)
+                await self._run(_destroy)
+                self._containers.pop(vm.container_id, None)
             except Exception as e:
                 await logger.awarning("Failed to destroy container", vm_id=vm.id, error=str(e))
+            self._last_ok.pop(vm.container_id, None)
         vm.state = VMState.DESTROYED
 
     async def exec_in_vm(self, vm: VM, command: str, timeout: int = 120) -> tuple[int, str, str]:
         if not vm.container_id:
             return (1, "", "No container ID")
 
-        docker_client = self._get_docker()
+        cap = self._EXEC_OUTPUT_CAP
+        grace = self._EXEC_KILL_GRACE_S
 
         def _exec():
-            container = docker_client.containers.get(vm.container_id)
-            return container.exec_run(
-                cmd=["bash", "-c", command],
-                demux=True,
+            # Low-level API so output is consumed as it streams into two bounded
+            # buffers, rather than docker-py joining it into one big bytes first
+            api = self._get_docker().api
+            exec_id = api.exec_create(
+                vm.container_id,
+                # Killing the command in the container also ends the output
+                # stream, which frees this worker thread
+                ["timeout", f"--kill-after={grace}", str(timeout), "bash", "-c", command],
                 environment={"TERM": "xterm"},
-            )
+            )["Id"]
+            out, err = bytearray(), bytearray()
+            for chunk_out, chunk_err in api.exec_start(exec_id, stream=True, demux=True):
+                if chunk_out and len(out) < cap:
+                    out += chunk_out[: cap - len(out)]
+                if chunk_err and len(err) < cap:
+                    err += chunk_err[: cap - len(err)]
+            return api.exec_inspect(exec_id)["ExitCode"], out, err
 
-        result = await asyncio.to_thread(_exec)
-        stdout = result.output[0].decode() if result.output[0] else ""
-        stderr = result.output[1].decode() if result.output[1] else ""
-        return (result.exit_code, stdout, stderr)
+        try:
+            exit_code, out, err = await asyncio.wait_for(
+                self._run(_exec, self._exec_executor), timeout + 2 * grace
+            )
+        except asyncio.TimeoutError:
+            # Only if the daemon itself stops answering; the worker thread is abandoned
+            await logger.awarning("Exec timed out", vm_id=vm.id, timeout_s=timeout)
+            return (124, "", f"Command timed out after {timeout}s")
+        # Any completed exec proves the container is up, whatever the command's exit code
+        self._last_ok[vm.container_id] = time.monotonic()
+        if len(out) >= cap or len(err) >= cap:
+            await logger.awarning("Exec output truncated", vm_id=vm.id, cap_bytes=cap)
+        return (exit_code, out.decode(errors="replace"), err.decode(errors="replace"))
 
     async def health_check(self, vm: VM) -> bool:
+        last_ok = self._last_ok.get(vm.container_id)
+        if last_ok is not None and time.monotonic() - last_ok < self._HEALTH_TTL_S:
+            return True
         try:
             exit_code, _, _ = await self.exec_in_vm(vm, "echo ok", timeout=5)
             return exit_code == 0
         except Exception:
             return False
 
+    async def reset_vm(self, vm: VM) -> bool:
+        exit_code, _, stderr = await self.exec_in_vm(vm, self._RESET_CMD, timeout=30)
+        if exit_code != 0:
+            await logger.awarning("VM reset failed", vm_id=vm.id, stderr=stderr[:200])
+            return False
+        return True
+
 
 class FirecrackerBackend(VMBackendDriver):
     """
@@ -168,33 +300,58 @@ class FirecrackerBackend(VMBackendDriver):
     2. Boot it, install all deps, clone repos
     3. Pause and snapshot the VM state
     4. On claim: restore from snapshot (instant boot)
+
+    The base snapshot is built lazily by the first create_vm, so constructing
+    the backend never touches the snapshot directory.
     """
 
+    def __init__(self):
+        self._snapshots: Optional[FirecrackerSnapshotManager] = None
+        self._base_snapshot_id: Optional[str] = None
+        self._snapshot_lock = asyncio.Lock()
+        self._instances: dict[str, str] = {}  # vm_id -> snapshot instance_id
+
+    async def _ensure_snapshot(self) -> str:
+        """Build the golden snapshot once; concurrent callers wait for the first build."""
+        if self._base_snapshot_id is not None:
+            return self._base_snapshot_id
+        async with self._snapshot_lock:
+            if self._base_snapshot_id is None:
+                settings = get_settings()
+                self._snapshots = FirecrackerSnapshotManager(
+                    SnapshotConfig(
+                        snapshot_dir=settings.snapshot_dir,
+                        kernel_path=settings.firecracker_kernel,
+                        rootfs_path=settings.firecracker_rootfs,
+                    )
+                )
+                snapshot = await self._snapshots.create_base_snapshot()
+                self._base_snapshot_id = snapshot.snapshot_id
+        return self._base_snapshot_id
+
     async def create_vm(self, vm: VM) -> VM:
-        settings = get_settings()
+        snapshot_id = await self._ensure_snapshot()
+        instance = await self._snapshots.restore_from_snapshot(snapshot_id)
+        self._instances[vm.id] = instance["instance_id"]
         vm.state = VMState.WARMING
-
-        # In production, this would:
-        # 1. Create a Firecracker microVM via its API socket
-        # 2. Configure kernel, rootfs, network
-        # 3. Boot the VM
         await logger.ainfo(
-            "Firecracker VM creation (stub)",
+            "Firecracker VM restored",
             vm_id=vm.id,
-            kernel=settings.firecracker_kernel,
+            instance_id=instance["instance_id"],
+            restore_time_ms=round(instance["restore_time_ms"], 2),
         )
         return vm
 
     async def warm_vm(self, vm: VM, repo_url: Optional[str] = None) -> VM:
-        # In production:
-        # 1. SSH into VM, install Goose + deps
-        # 2. Clone the default repo
-        # 3. Snapshot the VM for instant restore
+        # Tools and deps were baked into the base snapshot, so a restored VM
+        # is ready as soon as it resumes
         vm.state = VMState.READY
         return vm
 
     async def destroy_vm(self, vm: VM) -> None:
-        # In production: kill the Firecracker process, clean up socket + snapshot files
+        instance_id = self._instances.pop(vm.id, None)
+        if instance_id and self._snapshots:
+            await self._snapshots.cleanup(instance_id)
         vm.state = VMState.DESTROYED
 
     async def exec_in_vm(self, vm: VM, command: str, timeout: int = 120) -> tuple[int, str, str]:
@@ -205,6 +362,23 @@ class FirecrackerBackend(VMBackendDriver):
         return True
 
 
+class _RollingMean:
+    """Mean of the last `maxlen` samples, kept as a running sum so reads are O(1)."""
+
+    def __init__(self, maxlen: int):
+        self._buf: deque[float] = deque(maxlen=maxlen)
+        self._sum = 0.0
+
+    def append(self, value: float) -> None:
+        if len(self._buf) == self._buf.maxlen:
+            self._sum -= self._buf[0]  # about to be evicted by the append
+        self._sum += value
+        self._buf.append(value)
+
+    def mean(self) -> float:
+        return self._sum / len(self._buf) if self._buf else 0.0
+
+
 class WarmPoolManager:
     """
     Manages the warm pool of pre-warmed VMs.
@@ -218,10 +392,14 @@ class WarmPoolManager:
     the refill loop spins up a replacement in the background.
     """
 
+    _CLAIM_WAIT_S = 0.5  # how long an empty-pool claim waits for a refill
+    _REFILL_RECHECK_S = 10.0
+
     def __init__(self, backend: Optional[VMBackendDriver] = None):
         settings = get_settings()
         self.target_size = settings.warm_pool_size
         self.refill_threshold = settings.warm_pool_refill_threshold
+        self.max_vm_reuses = settings.max_vm_reuses
 
         if backend:
             self.backend = backend
@@ -229,13 +407,30 @@ class WarmPoolManager:
             self.backend = DockerBackend()
         else:
             self.backend = FirecrackerBackend()
+        self._backend_enum = (
+            VMBackend.DOCKER if isinstance(self.backend, DockerBackend) else VMBackend.FIRECRACKER
+        )
 
         self._pool: deque[VM] = deque()
         self._claimed: dict[str, VM] = {}  # task_id -> VM
-        self._all_vms: dict[str, VM] = {}  # vm_id -> VM
-        self._lock = asyncio.Lock()
+        # Pool/claim updates never straddle an await, so the event loop already
+        # makes them atomic; these only serialize the slow create paths
+        self._on_demand = asyncio.Semaphore(settings.warm_pool_max_on_demand)
+        self._fill_lock = asyncio.Lock()
+        # Wake the refill loop as soon as the pool dips, and let empty-pool
+        # claims wait briefly for an in-flight VM instead of building their own
+        self._refill_needed = asyncio.Event()
+        self._vm_available = asyncio.Event()
         self._refill_task: Optional[asyncio.Task] = None
-        self._claim_times: deque[float] = deque(maxlen=100)
+        # Released VMs are torn down in the background so release_vm returns
+        # without waiting on a container stop
+        self._destroy_queue: asyncio.Queue[tuple[VM, str]] = asyncio.Queue()
+        self._destroyer_task: Optional[asyncio.Task] = None
+        self._claim_times = _RollingMean(maxlen=100)
+        # VMs mid-create (CREATING) and failed VMs not yet torn down (ERROR) —
+        # neither kind is ever in _pool or _claimed, so get_stats can't scan for them
+        self._state_counts: Counter[VMState] = Counter()
+        self._create_failures_total = 0
         self._running = False
 
     async def start(self):
@@ -243,6 +438,7 @@ class WarmPoolManager:
         self._running = True
         await logger.ainfo("Starting warm pool manager", target_size=self.target_size)
         self._refill_task = asyncio.create_task(self._refill_loop())
+        self._destroyer_task = asyncio.create_task(self._destroyer_loop())
         # Initial fill
         await self._fill_pool()
 
@@ -251,16 +447,28 @@ class WarmPoolManager:
         self._running = False
         if self._refill_task:
             self._refill_task.cancel()
-
-        async with self._lock:
-            for vm in list(self._pool) + list(self._claimed.values()):
-                try:
-                    await self.backend.destroy_vm(vm)
-                except Exception as e:
-                    await logger.awarning("Error destroying VM during shutdown", error=str(e))
-
+            # Let an interrupted fill tear down its builds before we snapshot
+            await asyncio.wait({self._refill_task})
+        # Detach first so releases that land from here on destroy inline rather
+        # than queueing behind a consumer that's about to be cancelled
+        destroyer, self._destroyer_task = self._destroyer_task, None
+        if destroyer:
+            await self._destroy_queue.join()
+            destroyer.cancel()
+
+        # Snapshot first — the pool/claim map may change while teardowns await
+        vms = list(self.all_vms)
+        await asyncio.gather(*(self._destroy_on_shutdown(vm) for vm in vms))
+
+        await self.backend.close()
         await logger.ainfo("Warm pool manager stopped")
 
+    async def _destroy_on_shutdown(self, vm: VM) -> None:
+        try:
+            await self.backend.destroy_vm(vm)
+        except Exception as e:
+            await logger.awarning("Error destroying VM during shutdown", vm_id=vm.id, error=str(e))
+
     async def claim_vm(self, task_id: str) -> VM:
         """
         Claim a VM from the warm pool for a task.
@@ -268,28 +476,18 @@ class WarmPoolManager:
         """
         start = time.monotonic()
 
-        async with self._lock:
-            if not self._pool:
-                # Emergency: no VMs available, create one on-demand
-                await logger.awarning("Pool empty, creating VM on-demand", task_id=task_id)
-                vm = VM(
-                    backend=VMBackend.DOCKER
-                    if isinstance(self.backend, DockerBackend)
-                    else VMBackend.FIRECRACKER
-                )
-                vm = await self.backend.create_vm(vm)
-                vm = await self.backend.warm_vm(vm)
-            else:
-                vm = self._pool.popleft()
+        vm = self._take_from_pool()
+        if vm is None:
+            vm = await self._wait_for_vm(task_id)
 
-            vm.claim(task_id)
-            self._claimed[task_id] = vm
-            self._all_vms[vm.id] = vm
+        vm.claim(task_id)
+        self._claimed[task_id] = vm
 
         claim_time_ms = (time.monotonic() - start) * 1000
         self._claim_times.append(claim_time_ms)
 
-        await logger.ainfo(
+        # Sync call: ainfo would add a default-executor round-trip to every claim
+        logger.info(
             "VM claimed",
             vm_id=vm.id,
             task_id=task_id,
@@ -299,69 +497,208 @@ class WarmPoolManager:
         return vm
 
     async def release_vm(self, task_id: str) -> None:
-        """Release a VM back after task completion — destroys and triggers refill."""
-        async with self._lock:
-            vm = self._claimed.pop(task_id, None)
+        """
+        Release a VM after task completion.
+
+        VMs under their reuse budget are scrubbed and returned to the pool;
+        everything else is destroyed and left for the refill loop to replace.
+        """
+        vm = self._claimed.pop(task_id, None)
+        if not vm:
+            return
+
+        vm.release()
+        if await self._recycle_vm(vm):
+            await logger.ainfo(
+                "VM released and recycled", vm_id=vm.id, task_id=task_id, reuse_count=vm.reuse_count
+            )
+            return
 
-        if vm:
+        if self._destroyer_task and not self._destroyer_task.done():
+            self._destroy_queue.put_nowait((vm, task_id))
+        else:
+            await self._destroy(vm, task_id)
+
+    async def _destroyer_loop(self):
+        """Background consumer for released VMs; drained by stop() before it exits."""
+        while True:
+            vm, task_id = await self._destroy_queue.get()
+            try:
+                await self._destroy(vm, task_id)
+            finally:
+                self._destroy_queue.task_done()
+
+    async def _destroy(self, vm: VM, task_id: str) -> None:
+        try:
             await self.backend.destroy_vm(vm)
-            await logger.ainfo("VM released and destroyed", vm_id=vm.id, task_id=task_id)
+        except Exception as e:
+            await logger.awarning(
+                "Failed to destroy released VM", vm_id=vm.id, task_id=task_id, error=str(e)
+            )
+            return
+        await logger.ainfo("VM released and destroyed", vm_id=vm.id, task_id=task_id)
+
+    async def _recycle_vm(self, vm: VM) -> bool:
+        """Reset a released VM and return it to the pool. False means destroy it instead."""
+        if not self._running or vm.reuse_count >= self.max_vm_reuses:
+            return False
+        try:
+            if not await self.backend.health_check(vm) or not await self.backend.reset_vm(vm):
+                return False
+        except Exception as e:
+            await logger.awarning("VM recycle failed", vm_id=vm.id, error=str(e))
+            return False
+
+        # stop() may have snapshotted the pool while we awaited the reset
+        if not self._running or len(self._pool) >= self.target_size:
+            return False
+        vm.reuse_count += 1
+        vm.claimed_at = None
+        vm.state = VMState.READY
+        self._add_to_pool(vm)
+        return True
+
+    def _take_from_pool(self) -> Optional[VM]:
+        """Pop a ready VM (None if the pool is empty) and wake the refill loop if needed."""
+        vm = self._pool.popleft() if self._pool else None
+        if not self._pool:
+            self._vm_available.clear()
+        if len(self._pool) < self.refill_threshold:
+            self._refill_needed.set()
+        return vm
+
+    def _add_to_pool(self, vm: VM) -> None:
+        self._pool.append(vm)
+        self._vm_available.set()
+
+    async def _wait_for_vm(self, task_id: str) -> VM:
+        """Empty-pool path: give an in-flight refill a moment before building on demand."""
+        if self._running:
+            try:
+                await asyncio.wait_for(self._vm_available.wait(), timeout=self._CLAIM_WAIT_S)
+            except asyncio.TimeoutError:
+                pass
+            vm = self._take_from_pool()
+            if vm is not None:
+                return vm
+        return await self._create_on_demand(task_id)
+
+    async def _create_on_demand(self, task_id: str) -> VM:
+        """Emergency path for an empty pool, with a bounded number of builds at once."""
+        await logger.awarning("Pool empty, falling back to an on-demand VM", task_id=task_id)
+        async with self._on_demand:
+            # A refill or recycle may have landed while we waited for a slot
+            vm = self._take_from_pool()
+            if vm is not None:
+                return vm
+            return await self._create_and_warm_vm()
+
+    @property
+    def all_vms(self) -> Iterator[VM]:
+        """Every VM the pool currently owns — ready in the pool or claimed by a task."""
+        return itertools.chain(self._pool, self._claimed.values())
 
     async def get_vm(self, task_id: str) -> Optional[VM]:
         """Get the VM assigned to a task."""
         return self._claimed.get(task_id)
 
     def get_stats(self) -> WarmPoolStats:
-        avg_claim = sum(self._claim_times) / len(self._claim_times) if self._claim_times else 0
+        avg_claim = self._claim_times.mean()
         return WarmPoolStats(
             total_vms=len(self._pool) + len(self._claimed),
             ready_vms=len(self._pool),
             claimed_vms=len(self._claimed),
-            creating_vms=sum(1 for v in self._all_vms.values() if v.state == VMState.CREATING),
-            error_vms=sum(1 for v in self._all_vms.values() if v.state == VMState.ERROR),
-            backend=VMBackend.DOCKER
-            if isinstance(self.backend, DockerBackend)
-            else VMBackend.FIRECRACKER,
+            creating_vms=self._state_counts[VMState.CREATING],
+            error_vms=self._state_counts[VMState.ERROR],
+            create_failures_total=self._create_failures_total,
+            backend=self._backend_enum,
             target_pool_size=self.target_size,
             avg_claim_time_ms=round(avg_claim, 2),
         )
 
     async def _fill_pool(self):
-        """Fill the pool up to the target size."""
-        needed = self.target_size - len(self._pool)
-        if needed <= 0:
+        """Fill the pool up to the target size. A no-op while another fill is in flight."""
+        if self._fill_lock.locked():
             return
-
-        await logger.ainfo("Filling warm pool", needed=needed, current=len(self._pool))
-        tasks = [self._create_and_warm_vm() for _ in range(needed)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, VM):
-                async with self._lock:
-                    self._pool.append(result)
-                    self._all_vms[result.id] = result
-            elif isinstance(result, Exception):
-                await logger.aerror("Failed to create VM", error=str(result))
+        async with self._fill_lock:
+            needed = self.target_size - len(self._pool)
+            if needed <= 0:
+                return
+
+            await logger.ainfo("Filling warm pool", needed=needed, current=len(self._pool))
+            # Pool each VM as soon as it's ready rather than after the slowest one
+            builds = [asyncio.create_task(self._create_and_warm_vm()) for _ in range(needed)]
+            pooled: set[str] = set()
+            try:
+                for next_vm in asyncio.as_completed(builds):
+                    try:
+                        vm = await next_vm
+                    except Exception as e:
+                        await logger.aerror("Failed to create VM", error=str(e))
+                        continue
+                    self._add_to_pool(vm)
+                    pooled.add(vm.id)
+            finally:
+                # Only reached with builds left over if the fill was cancelled
+                # (stop() cancels the refill loop): don't leak their VMs
+                for build in builds:
+                    build.cancel()
+                await asyncio.wait(builds)
+                orphans = [
+                    b.result()
+                    for b in builds
+                    if not b.cancelled() and b.exception() is None and b.result().id not in pooled
+                ]
+                await asyncio.gather(*(self._destroy_on_shutdown(vm) for vm in orphans))
+
+    def _new_vm(self) -> VM:
+        return VM(backend=self._backend_enum)
 
     async def _create_and_warm_vm(self) -> VM:
         """Create a single VM and warm it up."""
-        vm = VM(
-            backend=VMBackend.DOCKER
-            if isinstance(self.backend, DockerBackend)
-            else VMBackend.FIRECRACKER
-        )
-        vm = await self.backend.create_vm(vm)
-        vm = await self.backend.warm_vm(vm)
+        vm = self._new_vm()
+        self._state_counts[VMState.CREATING] += 1
+        try:
+            vm = await self.backend.create_vm(vm)
+            vm = await self.backend.warm_vm(vm)
+        except Exception:
+            vm.state = VMState.ERROR
+            self._create_failures_total += 1
+            raise
+        except asyncio.CancelledError:
+            await self._destroy_on_shutdown(vm)  # cancelled mid-build, e.g. by stop()
+            raise
+        finally:
+            self._state_counts[VMState.CREATING] -= 1
+            if vm.state == VMState.ERROR:
+                await self._discard_failed_vm(vm)
         return vm
 
+    async def _discard_failed_vm(self, vm: VM) -> None:
+        """Tear down whatever a failed create left behind; it counts as ERROR until gone."""
+        self._state_counts[VMState.ERROR] += 1
+        try:
+            await self.backend.destroy_vm(vm)
+        except Exception as e:
+            await logger.awarning("Failed to destroy errored VM", vm_id=vm.id, error=str(e))
+            return
+        self._state_counts[VMState.ERROR] -= 1
+
     async def _refill_loop(self):
         """Background loop that keeps the pool topped up."""
         while self._running:
             try:
+                # Event-driven; the timeout is only a safety net for retrying
+                # after failed creates, since nothing else re-signals then
+                try:
+                    await asyncio.wait_for(
+                        self._refill_needed.wait(), timeout=self._REFILL_RECHECK_S
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._refill_needed.clear()
                 if len(self._pool) < self.refill_threshold:
                     await self._fill_pool()
-                await asyncio.sleep(2)
             except asyncio.CancelledError:
                 break
             except Exception as e: